@@ -13,6 +13,11 @@ from enum import Enum
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # === Enums ===
 
@@ -48,7 +53,7 @@ class RiskLevel(Enum):
 
 # === Input ===
 
-@dataclass
+@dataclass(slots=True)
 class JobSpec:
     """One row from the job_list CSV."""
     job_number: int
@@ -59,19 +64,19 @@ class JobSpec:
 
 # === SERP & Semantic Models ===
 
-@dataclass
+@dataclass(slots=True)
 class PAAQuestion:
     question: str
     position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RelatedSearch:
     query: str
     position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SERPResult:
     position: int
     title: str
@@ -81,7 +86,7 @@ class SERPResult:
     title_pattern: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GoogleIntelligence:
     query: str
     timestamp: datetime
@@ -96,7 +101,7 @@ class GoogleIntelligence:
     is_ymyl: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaEntity:
     type: str
     name: Optional[str] = None
@@ -104,7 +109,7 @@ class SchemaEntity:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetFingerprint:
     url: str
     timestamp: datetime
@@ -124,7 +129,7 @@ class TargetFingerprint:
     is_ecommerce: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PublisherProfile:
     domain: str
     timestamp: datetime
@@ -141,7 +146,7 @@ class PublisherProfile:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeSuggestion:
     concept: str
     rationale: str
@@ -154,7 +159,7 @@ class BridgeSuggestion:
     entities_to_avoid: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticBridge:
     publisher_domain: str
     target_url: str
@@ -172,7 +177,7 @@ class SemanticBridge:
 
 # === V5 NEW: Source Verification ===
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedSource:
     """A single trust link that has been verified by fetching the actual URL."""
     url: str
@@ -196,7 +201,7 @@ class VerifiedSource:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceVerificationResult:
     """Result of the source verification step for one job."""
     job_number: int
@@ -207,7 +212,7 @@ class SourceVerificationResult:
 
 # === Pipeline Output ===
 
-@dataclass
+@dataclass(slots=True)
 class Preflight:
     """Complete preflight analysis for one job — input to article generation."""
     job: JobSpec
@@ -269,4 +274,6 @@ class Preflight:
                 s.to_dict() for s in self.sources.verified_sources
             ]
 
+        if orjson is not None and indent == 2:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(data, indent=indent, ensure_ascii=False)
@@ -20,25 +20,32 @@ Usage:
 
 import asyncio
 import argparse
+import bisect
 import csv
+import functools
 import hashlib
 import json
+import os
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, is_dataclass
+from enum import Enum
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from urllib.parse import urlparse, quote_plus
 
 try:
     import aiohttp
-    from bs4 import BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
     HTTP_AVAILABLE = True
 except ImportError:
     HTTP_AVAILABLE = False
-    print("WARNING: aiohttp/beautifulsoup4 not installed. Publisher/target analysis disabled.")
+    print("WARNING: aiohttp/selectolax not installed. Publisher/target analysis disabled.")
 
 try:
     import numpy as np
@@ -48,19 +55,136 @@ except ImportError:
     EMBEDDINGS_AVAILABLE = False
     print("WARNING: sentence-transformers not installed. Semantic distance disabled.")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from models import (
     JobSpec, Preflight, PublisherProfile, TargetFingerprint,
-    SemanticBridge, BridgeSuggestion, SourceVerificationResult,
+    SemanticBridge, BridgeSuggestion, SourceVerificationResult, SchemaEntity,
     VerifiedSource, SemanticDistance, BridgeConfidence, RiskLevel,
     GoogleIntelligence, IntentType
 )
 
 
+# Text patterns (compiled once, used on every parsed page)
+_RE_DOMAIN_WORDS = re.compile(r'[a-zåäö]{4,}')
+_RE_WORD4 = re.compile(r'\b[a-zåäö]{4,}\b')
+_RE_WORD3 = re.compile(r'\b\w{3,}\b')
+_RE_NAV_END = re.compile(r'</nav\s*>', re.IGNORECASE)
+
+# URL vertical checks (one C-level scan per URL instead of a substring loop)
+_RE_CASINO = re.compile(r'casino|betting|spel')
+_RE_GAMBLING = re.compile(r'casino|betting|spel|odds')
+_RE_YMYL = re.compile(r'hälsa|health|medicin|juridik|legal')
+
+# Swedish + English function words, interned once for pointer-equal set hits
+_STOP_WORDS = frozenset(sys.intern(w) for w in (
+    "och", "att", "en", "det", "som", "är", "av", "för", "med",
+    "till", "den", "har", "de", "inte", "om", "ett", "vi", "på",
+    "the", "and", "to", "of", "a", "in", "is", "for", "on", "with",
+))
+
+# Everything TargetAnalyzer reads from a page, matched in one traversal
+_TARGET_SELECTOR = 'title, meta[name="description"], h1, h2, h3, strong, b'
+
+
+def _dedup_take(seq, n: int) -> List[str]:
+    """First `n` unique items of `seq`, in order; stops as soon as `n` are found."""
+    seen = set()
+    out = []
+    for x in seq:
+        if x not in seen:
+            seen.add(x)
+            out.append(x)
+            if len(out) == n:
+                break
+    return out
+
+
+def _partner_map(pairs) -> Dict[str, frozenset]:
+    """Group (a, b) keys by `a`: {a: frozenset of every b it is paired with}."""
+    partners: Dict[str, set] = {}
+    for a, b in pairs:
+        partners.setdefault(a, set()).add(b)
+    return {a: frozenset(bs) for a, bs in partners.items()}
+
+
+@functools.lru_cache(maxsize=2048)
+def _netloc(url: str) -> str:
+    """Host of `url` without a leading www. — memoized, urlparse is not cheap."""
+    return urlparse(url).netloc.replace("www.", "")
+
+
+# ============================================================
+# JSON HELPERS
+# ============================================================
+
+def _json_default(obj: Any) -> Any:
+    """stdlib fallback for the types orjson serializes natively."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when available).
+
+    Model dataclasses, datetimes and enums can be passed as-is.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cache_path(cache_dir: Path, key: str, suffix: str = ".json") -> Path:
+    """Cache file for `key` — blake2b digest, memoized for repeated lookups."""
+    return cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}{suffix}"
+
+
+def _write_cache(f: Path, obj: Any) -> None:
+    """Write a cache entry atomically: one write to a temp file, then rename."""
+    tmp = f.with_suffix(f.suffix + ".tmp")
+    tmp.write_bytes(_json_dumps(obj))
+    os.replace(tmp, f)
+
+
+def _read_cache(f: Path, max_age: timedelta) -> Optional[Dict[str, Any]]:
+    """Load a cache entry with its timestamp parsed; None if missing, broken or stale."""
+    try:
+        data = _json_loads(f.read_bytes())
+        ts = datetime.fromisoformat(data["timestamp"])
+    except Exception:
+        return None
+    if datetime.now() - ts > max_age:
+        return None
+    data["timestamp"] = ts
+    return data
+
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Centralized configuration for the entire pipeline."""
     # Paths
@@ -70,22 +194,77 @@ class PipelineConfig:
 
     # Embedding model
     embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
+    embedding_batch_size: int = 1024  # encode() length-sorts and pads per batch
+    embedding_backend: str = "openvino"  # openvino → onnx → torch, first that loads
 
     # Semantic thresholds
     identical_threshold: float = 0.90
     close_threshold: float = 0.70
     moderate_threshold: float = 0.50
     distant_threshold: float = 0.30
+    bridge_match_threshold: float = 0.80  # fuzzy VERTICAL_BRIDGES key match
 
     # HTTP
     http_timeout: int = 10
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    http_pool_size: int = 32
+    http_pool_per_host: int = 8
+    concurrency: int = 8  # jobs analyzed at once
+    max_html_bytes: int = 262_144  # title/meta/nav/headings live in the first chunk
+    max_homepage_bytes: int = 65_536  # homepage profiling only needs <head> + first <nav>
 
     # Cache TTL
     publisher_cache_hours: int = 72
     target_cache_hours: int = 24
 
 
+# ============================================================
+# HTTP SESSION
+# ============================================================
+
+def create_session(config: PipelineConfig) -> "aiohttp.ClientSession":
+    """Pooled keep-alive session shared by all fetches in a pipeline run."""
+    connector = aiohttp.TCPConnector(
+        limit=config.http_pool_size,
+        limit_per_host=config.http_pool_per_host,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=config.http_timeout),
+        headers={"User-Agent": config.user_agent},
+    )
+
+
+@asynccontextmanager
+async def _session_scope(session: Optional["aiohttp.ClientSession"], config: PipelineConfig):
+    """Yield the shared session, or a short-lived one for standalone tool calls."""
+    if session is not None:
+        yield session
+    else:
+        async with create_session(config) as own:
+            yield own
+
+
+async def _read_html(resp: "aiohttp.ClientResponse", limit: int) -> str:
+    """Read at most `limit` bytes of the body and decode with the response charset."""
+    # content.read(n) returns whatever is buffered (up to n), so keep reading until the
+    # limit or EOF; otherwise the document is cut at the first network chunk
+    buf = bytearray()
+    while len(buf) < limit:
+        chunk = await resp.content.readany()
+        if not chunk:
+            break
+        buf += chunk
+    raw = bytes(buf[:limit])
+    try:
+        return raw.decode(resp.charset or "utf-8", errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
 # ============================================================
 # PUBLISHER PROFILER (from publisher_sampler_light.py)
 # ============================================================
@@ -130,22 +309,33 @@ class PublisherProfiler:
         "gutt": ["livsstil", "mode"],
     }
 
-    STOP_WORDS = {
-        "och", "att", "en", "det", "som", "är", "av", "för", "med",
-        "till", "den", "har", "de", "inte", "om", "ett", "vi", "på",
-        "the", "and", "to", "of", "a", "in", "is", "for", "on", "with",
-        "hem", "start", "nyheter", "senaste", "alla"
-    }
+    STOP_WORDS = _STOP_WORDS | frozenset(
+        sys.intern(w) for w in ("hem", "start", "nyheter", "senaste", "alla")
+    )
 
-    def __init__(self, config: PipelineConfig):
+    DOMAIN_STOP_WORDS = frozenset(sys.intern(w) for w in ("nytt", "tidning", "bladet"))
+
+    _domain_automaton = None  # Aho-Corasick over DOMAIN_MAP, built on first use
+
+    def __init__(self, config: PipelineConfig, session: Optional["aiohttp.ClientSession"] = None):
         self.config = config
+        self.session = session
         self._cache_dir = Path(config.output_dir) / config.cache_dir / "publisher"
+        self._max_age = timedelta(hours=config.publisher_cache_hours)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-    async def analyze(self, domain: str) -> PublisherProfile:
+    @staticmethod
+    def normalize_domain(domain: str) -> str:
         domain = domain.replace("www.", "").lower()
         if domain.startswith("http"):
             domain = urlparse(domain).netloc.replace("www.", "")
+        return domain
+
+    def is_cached(self, domain: str) -> bool:
+        return self._get_cached(self.normalize_domain(domain)) is not None
+
+    async def analyze(self, domain: str) -> PublisherProfile:
+        domain = self.normalize_domain(domain)
 
         cached = self._get_cached(domain)
         if cached:
@@ -154,7 +344,7 @@ class PublisherProfiler:
         topics = self._topics_from_domain(domain)
         homepage = await self._quick_homepage(f"https://{domain}") if HTTP_AVAILABLE else {}
 
-        all_topics = list(dict.fromkeys(topics + homepage.get("topics", [])))[:10]
+        all_topics = _dedup_take(topics + homepage.get("topics", []), 10)
         if not all_topics:
             all_topics = ["allmänt"]
 
@@ -175,86 +365,99 @@ class PublisherProfiler:
     def _topics_from_domain(self, domain: str) -> List[str]:
         name = domain.split(".")[0].lower()
         topics = []
-        for pattern, pattern_topics in self.DOMAIN_MAP.items():
-            if pattern in name:
-                topics.extend(pattern_topics)
+        if ahocorasick is not None:
+            # One automaton pass; keep DOMAIN_MAP order for the matched patterns
+            hits = dict(match for _, match in self._get_domain_automaton().iter(name))
+            for i in sorted(hits):
+                topics.extend(hits[i])
+        else:
+            for pattern, pattern_topics in self.DOMAIN_MAP.items():
+                if pattern in name:
+                    topics.extend(pattern_topics)
         if not topics:
-            words = re.findall(r'[a-zåäö]{4,}', name)
-            topics = [w for w in words if w not in {"nytt", "tidning", "bladet"}]
-        return list(dict.fromkeys(topics))[:5]
+            words = _RE_DOMAIN_WORDS.findall(name)
+            topics = [w for w in words if w not in self.DOMAIN_STOP_WORDS]
+        return _dedup_take(topics, 5)
+
+    @classmethod
+    def _get_domain_automaton(cls):
+        if cls._domain_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for i, (pattern, pattern_topics) in enumerate(cls.DOMAIN_MAP.items()):
+                automaton.add_word(pattern, (i, pattern_topics))
+            automaton.make_automaton()
+            cls._domain_automaton = automaton
+        return cls._domain_automaton
 
     async def _quick_homepage(self, url: str) -> Dict[str, Any]:
-        result = {"site_name": None, "description": None, "language": "sv", "topics": [], "categories": []}
         try:
             timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers={"User-Agent": self.config.user_agent}, allow_redirects=True) as resp:
+            async with _session_scope(self.session, self.config) as session:
+                async with session.get(url, timeout=timeout, allow_redirects=True) as resp:
                     if resp.status != 200:
-                        return result
-                    html = await resp.text()
+                        return self._empty_homepage()
+                    html = await _read_html(resp, self.config.max_homepage_bytes)
+        except Exception:
+            return self._empty_homepage()
+        # Parse off the event loop so other jobs' fetches keep progressing
+        return await asyncio.to_thread(self._parse_homepage, html)
 
-            soup = BeautifulSoup(html, "html.parser")
-            title_tag = soup.find("title")
+    @staticmethod
+    def _empty_homepage() -> Dict[str, Any]:
+        return {"site_name": None, "description": None, "language": "sv", "topics": [], "categories": []}
+
+    def _parse_homepage(self, html: str) -> Dict[str, Any]:
+        result = self._empty_homepage()
+        try:
+            # title/meta/lang and the first <nav> all come before its </nav>; skip the rest
+            nav_end = _RE_NAV_END.search(html)
+            if nav_end:
+                html = html[:nav_end.end()]
+            tree = LexborHTMLParser(html)
+            title_tag = tree.css_first("title")
             if title_tag:
-                title = title_tag.text.strip()
+                title = title_tag.text(strip=True)
                 result["site_name"] = title.split("|")[0].split("-")[0].strip()
                 result["topics"].extend(self._extract_topics(title))
 
-            meta = soup.find("meta", attrs={"name": "description"})
+            meta = tree.css_first('meta[name="description"]')
             if meta:
-                desc = meta.get("content", "")
+                desc = meta.attributes.get("content") or ""
                 result["description"] = desc
                 result["topics"].extend(self._extract_topics(desc))
 
-            html_tag = soup.find("html")
-            if html_tag and html_tag.get("lang"):
-                result["language"] = html_tag["lang"].split("-")[0]
+            html_tag = tree.css_first("html")
+            if html_tag and html_tag.attributes.get("lang"):
+                result["language"] = html_tag.attributes["lang"].split("-")[0]
 
-            nav = soup.find("nav") or soup.find("header")
+            nav = tree.css_first("nav") or tree.css_first("header")
             if nav:
-                for link in nav.find_all("a", limit=10):
-                    text = link.get_text(strip=True)
+                for link in nav.css("a")[:10]:
+                    text = link.text(strip=True)
                     if text and 2 < len(text) < 25:
                         result["categories"].append(text)
 
-            result["topics"] = list(dict.fromkeys(result["topics"]))[:10]
+            result["topics"] = _dedup_take(result["topics"], 10)
         except Exception:
             pass
         return result
 
     def _extract_topics(self, text: str) -> List[str]:
-        words = re.findall(r'\b[a-zåäö]{4,}\b', text.lower())
-        return [w for w in words if w not in self.STOP_WORDS][:5]
+        words = (w for w in _RE_WORD4.findall(text.lower()) if w not in self.STOP_WORDS)
+        return [w for w, _ in Counter(words).most_common(5)]
 
     def _get_cached(self, domain: str) -> Optional[PublisherProfile]:
-        f = self._cache_dir / f"{hashlib.md5(domain.encode()).hexdigest()}.json"
-        if not f.exists():
+        data = _read_cache(_cache_path(self._cache_dir, domain), self._max_age)
+        if data is None:
             return None
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            ts = datetime.fromisoformat(data["timestamp"])
-            if datetime.now() - ts > timedelta(hours=self.config.publisher_cache_hours):
-                return None
-            return PublisherProfile(
-                domain=data["domain"], timestamp=ts,
-                site_name=data.get("site_name"), site_description=data.get("site_description"),
-                primary_language=data.get("primary_language", "sv"),
-                primary_topics=data.get("primary_topics", []),
-                category_structure=data.get("category_structure", []),
-                confidence=data.get("confidence", 0.5)
-            )
+            return PublisherProfile(**data)
         except Exception:
             return None
 
     def _cache(self, domain: str, p: PublisherProfile):
-        f = self._cache_dir / f"{hashlib.md5(domain.encode()).hexdigest()}.json"
         try:
-            f.write_text(json.dumps({
-                "domain": p.domain, "timestamp": p.timestamp.isoformat(),
-                "site_name": p.site_name, "site_description": p.site_description,
-                "primary_language": p.primary_language, "primary_topics": p.primary_topics,
-                "category_structure": p.category_structure, "confidence": p.confidence
-            }, ensure_ascii=False, indent=2), encoding="utf-8")
+            _write_cache(_cache_path(self._cache_dir, domain), p)
         except Exception:
             pass
 
@@ -264,13 +467,20 @@ class PublisherProfiler:
 # ============================================================
 
 class TargetAnalyzer:
-    """Lightweight target page analysis using HTTP + BeautifulSoup."""
+    """Lightweight target page analysis using HTTP + selectolax."""
 
-    def __init__(self, config: PipelineConfig):
+    STOP_WORDS = _STOP_WORDS
+
+    def __init__(self, config: PipelineConfig, session: Optional["aiohttp.ClientSession"] = None):
         self.config = config
+        self.session = session
         self._cache_dir = Path(config.output_dir) / config.cache_dir / "target"
+        self._max_age = timedelta(hours=config.target_cache_hours)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def is_cached(self, url: str) -> bool:
+        return self._get_cached(url) is not None
+
     async def analyze(self, url: str) -> TargetFingerprint:
         cached = self._get_cached(url)
         if cached:
@@ -280,12 +490,11 @@ class TargetAnalyzer:
 
         if HTTP_AVAILABLE:
             try:
-                timeout = aiohttp.ClientTimeout(total=self.config.http_timeout)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url, headers={"User-Agent": self.config.user_agent}) as resp:
+                async with _session_scope(self.session, self.config) as session:
+                    async with session.get(url) as resp:
                         if resp.status == 200:
-                            html = await resp.text()
-                            result = self._parse_html(url, html)
+                            html = await _read_html(resp, self.config.max_html_bytes)
+                            result = await asyncio.to_thread(self._parse_html, url, html)
             except Exception:
                 pass
 
@@ -293,29 +502,32 @@ class TargetAnalyzer:
         return result
 
     def _parse_html(self, url: str, html: str) -> TargetFingerprint:
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
 
-        title = ""
-        t = soup.find("title")
-        if t:
-            title = t.get_text(strip=True)
-
-        meta_desc = ""
-        m = soup.find("meta", {"name": "description"})
-        if m:
-            meta_desc = m.get("content", "")
-
-        h1 = ""
-        h = soup.find("h1")
-        if h:
-            h1 = h.get_text(strip=True)
+        # Single traversal in document order; first title/meta/h1 wins
+        title = meta_desc = h1 = None
+        texts = []
+        for node in tree.css(_TARGET_SELECTOR):
+            tag = node.tag
+            if tag == "title":
+                if title is None:
+                    title = node.text(strip=True)
+            elif tag == "meta":
+                if meta_desc is None:
+                    meta_desc = node.attributes.get("content") or ""
+            else:
+                text = node.text(strip=True)
+                if tag == "h1" and h1 is None:
+                    h1 = text
+                texts.append(text)
+        title, meta_desc, h1 = title or "", meta_desc or "", h1 or ""
 
         lang = "sv"
-        html_tag = soup.find("html")
-        if html_tag and html_tag.get("lang"):
-            lang = html_tag["lang"].split("-")[0]
+        html_tag = tree.root
+        if html_tag and html_tag.attributes.get("lang"):
+            lang = html_tag.attributes["lang"].split("-")[0]
 
-        keywords = self._extract_keywords(soup)
+        keywords = self._extract_keywords(texts)
         topic_cluster = self._meaningful_words(f"{title} {meta_desc} {h1}")
 
         return TargetFingerprint(
@@ -325,53 +537,26 @@ class TargetAnalyzer:
             topic_cluster=topic_cluster
         )
 
-    def _extract_keywords(self, soup) -> List[str]:
-        texts = []
-        for tag in soup.find_all(["h1", "h2", "h3", "strong", "b"]):
-            texts.append(tag.get_text(strip=True))
+    def _extract_keywords(self, texts: List[str]) -> List[str]:
         return self._meaningful_words(" ".join(texts))[:20]
 
     def _meaningful_words(self, text: str) -> List[str]:
-        stop = {"och", "att", "en", "det", "som", "är", "av", "för", "med",
-                "till", "den", "har", "de", "inte", "om", "ett", "vi", "på",
-                "the", "and", "to", "of", "a", "in", "is", "for", "on", "with"}
-        words = re.findall(r'\b\w{3,}\b', text.lower())
-        freq = {}
-        for w in words:
-            if w not in stop:
-                freq[w] = freq.get(w, 0) + 1
-        return sorted(freq, key=lambda x: freq[x], reverse=True)[:15]
+        words = (w for w in _RE_WORD3.findall(text.lower()) if w not in self.STOP_WORDS)
+        return [w for w, _ in Counter(words).most_common(15)]
 
     def _get_cached(self, url: str) -> Optional[TargetFingerprint]:
-        key = hashlib.md5(url.encode()).hexdigest()
-        f = self._cache_dir / f"{key}.json"
-        if not f.exists():
+        data = _read_cache(_cache_path(self._cache_dir, url), self._max_age)
+        if data is None:
             return None
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            ts = datetime.fromisoformat(data["timestamp"])
-            if datetime.now() - ts > timedelta(hours=self.config.target_cache_hours):
-                return None
-            return TargetFingerprint(
-                url=data["url"], timestamp=ts,
-                title=data.get("title", ""), meta_description=data.get("meta_description", ""),
-                h1=data.get("h1", ""), language=data.get("language", "sv"),
-                main_keywords=data.get("main_keywords", []),
-                topic_cluster=data.get("topic_cluster", [])
-            )
+            data["schema_entities"] = [SchemaEntity(**e) for e in data.get("schema_entities", [])]
+            return TargetFingerprint(**data)
         except Exception:
             return None
 
     def _cache(self, url: str, t: TargetFingerprint):
-        key = hashlib.md5(url.encode()).hexdigest()
-        f = self._cache_dir / f"{key}.json"
         try:
-            f.write_text(json.dumps({
-                "url": t.url, "timestamp": t.timestamp.isoformat(),
-                "title": t.title, "meta_description": t.meta_description,
-                "h1": t.h1, "language": t.language,
-                "main_keywords": t.main_keywords, "topic_cluster": t.topic_cluster
-            }, ensure_ascii=False, indent=2), encoding="utf-8")
+            _write_cache(_cache_path(self._cache_dir, url), t)
         except Exception:
             pass
 
@@ -380,6 +565,63 @@ class TargetAnalyzer:
 # SEMANTIC ENGINE (from semantic_engine.py)
 # ============================================================
 
+# Normalized embeddings are stored as symmetric int8 with one fixed scale;
+# five distance buckets don't need FP32 precision.
+_INT8_SCALE = 1.0 / 127
+
+
+def _quantize(embs):
+    """L2-normalized float embeddings → int8 (value ≈ q * _INT8_SCALE)."""
+    return np.clip(np.round(embs * 127), -127, 127).astype(np.int8)
+
+
+class EmbeddingCache:
+    """On-disk int8 embedding store keyed by blake2b(model name | text).
+
+    Files are sharded into 256 subdirectories by the first two hex digits of
+    the key so large corpora don't end up in one flat directory. Entries from
+    the older flat layout are moved into their shard the first time they are read.
+    """
+
+    def __init__(self, config: PipelineConfig):
+        self.model_name = config.embedding_model
+        self._cache_dir = Path(config.output_dir) / config.cache_dir / "emb"
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _flat_path(self, text: str) -> Path:
+        return _cache_path(self._cache_dir, f"{self.model_name}|int8|{text}", ".npy")
+
+    def _path(self, text: str) -> Path:
+        f = self._flat_path(text)
+        return f.parent / f.name[:2] / f.name
+
+    def get(self, text: str):
+        f = self._path(text)
+        try:
+            return np.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            return None
+        # Miss: migrate an entry written before sharding, if there is one
+        flat = self._flat_path(text)
+        try:
+            vec = np.load(flat)
+            f.parent.mkdir(exist_ok=True)
+            os.replace(flat, f)
+            return vec
+        except Exception:
+            return None
+
+    def put(self, text: str, vec) -> None:
+        f = self._path(text)
+        try:
+            f.parent.mkdir(exist_ok=True)
+            np.save(f, vec)
+        except Exception:
+            pass
+
+
 class SemanticEngine:
     """Calculates semantic distance and generates bridge suggestions."""
 
@@ -401,16 +643,102 @@ class SemanticEngine:
         ("casino", "casino"): ["spelmarknad", "reglering", "operatörer"],
     }
 
+    # publisher topic → target words it has a bridge to
+    _BRIDGE_PARTNERS = _partner_map(VERTICAL_BRIDGES)
+
+    # Distance buckets in ascending threshold order (index = thresholds passed)
+    DISTANCE_CATEGORIES = (
+        SemanticDistance.UNRELATED, SemanticDistance.DISTANT, SemanticDistance.MODERATE,
+        SemanticDistance.CLOSE, SemanticDistance.IDENTICAL,
+    )
+
     def __init__(self, config: PipelineConfig):
         self.config = config
         self._model = None
+        self._model_lock = threading.Lock()
+        self._embeddings: Dict[str, Any] = {}
+        self._disk_cache = EmbeddingCache(config)
+        self._bridge_keys = list(self.VERTICAL_BRIDGES)
+        self._bridge_key_embs = None
+        # "topic word" query -> int8 embedding for the fuzzy bridge fallback; in memory
+        # only, these one-off pair strings are not worth a disk-cache file each
+        self._bridge_query_embs: Dict[str, Any] = {}
+        self._encode_kwargs = dict(
+            batch_size=config.embedding_batch_size, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False
+        )
+        self._thresholds = (
+            config.distant_threshold, config.moderate_threshold,
+            config.close_threshold, config.identical_threshold,
+        )
+
+    # int8-quantized CPU exports, tried in this order before plain PyTorch
+    QUANTIZED_BACKENDS = (
+        ("openvino", "openvino/openvino_model_qint8_quantized.xml"),
+        ("onnx", "onnx/model_qint8_avx512_vnni.onnx"),
+    )
 
     def _get_model(self):
         if self._model is None and EMBEDDINGS_AVAILABLE:
-            print(f"Loading embedding model: {self.config.embedding_model}")
-            self._model = SentenceTransformer(self.config.embedding_model)
+            # Pipeline preloads on a background thread; callers wait for that load
+            with self._model_lock:
+                if self._model is None:
+                    print(f"Loading embedding model: {self.config.embedding_model}")
+                    self._model = self._load_model()
         return self._model
 
+    def _load_model(self):
+        names = [b for b, _ in self.QUANTIZED_BACKENDS]
+        start = names.index(self.config.embedding_backend) if self.config.embedding_backend in names else len(names)
+        for backend, file_name in self.QUANTIZED_BACKENDS[start:]:
+            try:
+                return SentenceTransformer(
+                    self.config.embedding_model, backend=backend,
+                    model_kwargs={"file_name": file_name}
+                )
+            except Exception as e:
+                print(f"  {backend} backend unavailable ({type(e).__name__}), trying next")
+        return SentenceTransformer(self.config.embedding_model)
+
+    @staticmethod
+    def bridge_texts(publisher: PublisherProfile, target: TargetFingerprint) -> Tuple[str, str]:
+        """Texts compared for semantic distance: (publisher, target)."""
+        pub_text = " ".join(publisher.primary_topics)
+        target_text = " ".join(target.main_keywords[:10] + target.topic_cluster[:5])
+        if not target_text:
+            target_text = target.title + " " + target.h1
+        return pub_text, target_text
+
+    def encode_batch(self, texts: List[str]):
+        """Encode all not-yet-seen texts in one batched model call.
+
+        Embeddings are L2-normalized, quantized to int8 and kept in memory,
+        so later _cosine_similarity calls reduce to an integer dot product.
+        Texts already on disk from earlier runs are loaded instead of
+        re-encoded.
+        """
+        model = self._get_model()
+        if model is None:
+            return None
+        missing = []
+        for t in dict.fromkeys(texts):
+            if t in self._embeddings:
+                continue
+            cached = self._disk_cache.get(t)
+            if cached is not None:
+                self._embeddings[t] = cached
+            else:
+                missing.append(t)
+        if missing:
+            # Length-sorted so each batch pads to near its own mean length;
+            # results are keyed by text, so no un-permute is needed
+            missing.sort(key=len)
+            embs = model.encode(missing, **self._encode_kwargs)
+            for t, vec in zip(missing, _quantize(embs)):
+                self._embeddings[t] = vec
+                self._disk_cache.put(t, vec)
+        return np.stack([self._embeddings[t] for t in texts])
+
     def analyze(
         self,
         publisher: PublisherProfile,
@@ -418,14 +746,38 @@ class SemanticEngine:
         anchor_text: str
     ) -> SemanticBridge:
         """Calculate semantic distance and generate bridge suggestions."""
+        texts = self.bridge_texts(publisher, target)
+        shortcut = self.text_overlap_similarity(*texts)
+        if shortcut is not None:
+            return self.analyze_with_distance(publisher, target, anchor_text, shortcut)
+        embeddings = self.encode_batch(list(texts))
+        if embeddings is None:
+            return self.analyze_with_embeddings(publisher, target, anchor_text, None, None)
+        self.encode_bridge_pairs(self.fuzzy_bridge_pairs(publisher, target))
+        return self.analyze_with_embeddings(
+            publisher, target, anchor_text, embeddings[0], embeddings[1]
+        )
 
-        pub_text = " ".join(publisher.primary_topics)
-        target_text = " ".join(target.main_keywords[:10] + target.topic_cluster[:5])
-        if not target_text:
-            target_text = target.title + " " + target.h1
+    def analyze_with_embeddings(
+        self,
+        publisher: PublisherProfile,
+        target: TargetFingerprint,
+        anchor_text: str,
+        emb_pub,
+        emb_tgt
+    ) -> SemanticBridge:
+        """analyze() with the bridge_texts() embeddings already computed."""
+        raw_distance = self._cosine_similarity(emb_pub, emb_tgt)
+        return self.analyze_with_distance(publisher, target, anchor_text, raw_distance)
 
-        # Calculate distance
-        raw_distance = self._cosine_similarity(pub_text, target_text)
+    def analyze_with_distance(
+        self,
+        publisher: PublisherProfile,
+        target: TargetFingerprint,
+        anchor_text: str,
+        raw_distance: float
+    ) -> SemanticBridge:
+        """analyze() with the publisher/target cosine similarity already computed."""
         category = self._categorize(raw_distance)
 
         # Generate bridges
@@ -433,11 +785,12 @@ class SemanticEngine:
 
         # Determine entities
         required = list(set(publisher.primary_topics[:3] + target.main_keywords[:3]))
-        forbidden = self._forbidden_entities(target)
+        url_lower = target.url.lower()
+        forbidden = self._forbidden_entities(target, url_lower)
 
         # Trust link guidance
         trust_topics = self._trust_link_topics(publisher, target)
-        trust_avoid = self._trust_link_avoid(target)
+        trust_avoid = self._trust_link_avoid(target, url_lower)
 
         # Recommended angle
         angle = None
@@ -459,27 +812,93 @@ class SemanticEngine:
             trust_link_avoid=trust_avoid
         )
 
-    def _cosine_similarity(self, text_a: str, text_b: str) -> float:
-        model = self._get_model()
-        if model is None:
+    def _cosine_similarity(self, emb_a, emb_b) -> float:
+        if emb_a is None or emb_b is None:
             return 0.5  # Fallback
 
-        embeddings = model.encode([text_a, text_b])
-        a, b = embeddings[0], embeddings[1]
-        cos = float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+        cos = float(emb_a.astype(np.int32) @ emb_b.astype(np.int32)) * _INT8_SCALE * _INT8_SCALE
         return max(0.0, min(1.0, cos))
 
+    @staticmethod
+    def text_overlap_similarity(text_a: str, text_b: str) -> Optional[float]:
+        """Similarity settled without the model: 1.0 for identical texts, 0.95 when
+        the token sets overlap by more than 90% (Jaccard); None otherwise."""
+        if not text_a.strip() or not text_b.strip():
+            return None
+        if text_a == text_b:
+            return 1.0
+        a_toks = set(text_a.lower().split())
+        b_toks = set(text_b.lower().split())
+        if len(a_toks & b_toks) / len(a_toks | b_toks) > 0.9:
+            return 0.95
+        return None
+
+    @staticmethod
+    def pair_similarities(embs_a, embs_b):
+        """Row-wise cosine of two (N, D) int8 embedding stacks, clamped to [0, 1]."""
+        dots = np.einsum("ij,ij->i", embs_a.astype(np.int32), embs_b.astype(np.int32))
+        return np.clip(dots * (_INT8_SCALE * _INT8_SCALE), 0.0, 1.0)
+
+    def _bridge_key_embeddings(self):
+        """int8 embeddings of every VERTICAL_BRIDGES key, encoded once per process
+        (and read back from the embedding disk cache on later runs)."""
+        if self._bridge_key_embs is None:
+            self._bridge_key_embs = self.encode_batch([f"{p} {t}" for p, t in self._bridge_keys])
+        return self._bridge_key_embs
+
+    @staticmethod
+    def _bridge_target_words(target: TargetFingerprint) -> List[str]:
+        return target.topic_cluster[:5] + target.main_keywords[:5]
+
+    def fuzzy_bridge_pairs(
+        self, publisher: PublisherProfile, target: TargetFingerprint
+    ) -> List[Tuple[str, str]]:
+        """(publisher topic, target word) pairs the fuzzy fallback compares to the
+        VERTICAL_BRIDGES keys; empty when an exact key already matches."""
+        tgt_words = self._bridge_target_words(target)
+        for pub_topic in publisher.primary_topics:
+            partners = self._BRIDGE_PARTNERS.get(pub_topic)
+            if partners and any(w in partners for w in tgt_words):
+                return []
+        return [(p, t) for p in publisher.primary_topics[:3] for t in _dedup_take(tgt_words, 10)]
+
+    def encode_bridge_pairs(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Embed fuzzy-bridge pairs in one model call, if the model is already loaded.
+
+        Never loads the model itself: without one the fallback is simply skipped.
+        """
+        model = self._model
+        texts = [t for t in dict.fromkeys(f"{p} {w}" for p, w in pairs) if t not in self._bridge_query_embs]
+        if model is None or not texts:
+            return
+        for t, vec in zip(texts, _quantize(model.encode(texts, **self._encode_kwargs))):
+            self._bridge_query_embs[t] = vec
+
+    def _fuzzy_bridge(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Optional[Tuple[Tuple[str, str], Tuple[str, str], float]]:
+        """Closest VERTICAL_BRIDGES key to any (publisher topic, target word) pair.
+
+        Pairs must have gone through encode_bridge_pairs(). Returns (bridge key,
+        matched pair, cosine), or None below config.bridge_match_threshold or
+        when the pairs were not encoded.
+        """
+        queries = [f"{p} {t}" for p, t in pairs]
+        if not queries or any(q not in self._bridge_query_embs for q in queries):
+            return None
+        keys = self._bridge_key_embeddings()
+        if keys is None:
+            return None
+        embs = np.stack([self._bridge_query_embs[q] for q in queries])
+        sims = embs.astype(np.int32) @ keys.astype(np.int32).T
+        q, k = np.unravel_index(int(sims.argmax()), sims.shape)
+        score = float(sims[q, k]) * _INT8_SCALE * _INT8_SCALE
+        if score < self.config.bridge_match_threshold:
+            return None
+        return self._bridge_keys[k], pairs[q], score
+
     def _categorize(self, score: float) -> SemanticDistance:
-        if score >= self.config.identical_threshold:
-            return SemanticDistance.IDENTICAL
-        elif score >= self.config.close_threshold:
-            return SemanticDistance.CLOSE
-        elif score >= self.config.moderate_threshold:
-            return SemanticDistance.MODERATE
-        elif score >= self.config.distant_threshold:
-            return SemanticDistance.DISTANT
-        else:
-            return SemanticDistance.UNRELATED
+        return self.DISTANCE_CATEGORIES[bisect.bisect_right(self._thresholds, score)]
 
     def _generate_bridges(
         self, publisher: PublisherProfile, target: TargetFingerprint,
@@ -487,12 +906,15 @@ class SemanticEngine:
     ) -> List[BridgeSuggestion]:
         suggestions = []
 
-        # Try pre-defined bridges
+        # Try pre-defined bridges — only (topic, word) pairs that exist are looked up
+        tgt_words = self._bridge_target_words(target)
         for pub_topic in publisher.primary_topics:
-            for tgt_word in target.topic_cluster[:5] + target.main_keywords[:5]:
-                key = (pub_topic, tgt_word)
-                if key in self.VERTICAL_BRIDGES:
-                    concepts = self.VERTICAL_BRIDGES[key]
+            partners = self._BRIDGE_PARTNERS.get(pub_topic)
+            if not partners:
+                continue
+            for tgt_word in tgt_words:
+                if tgt_word in partners:
+                    concepts = self.VERTICAL_BRIDGES[(pub_topic, tgt_word)]
                     suggestions.append(BridgeSuggestion(
                         concept=" → ".join(concepts),
                         rationale=f"Publisher ({pub_topic}) och target ({tgt_word}) kopplas via {concepts[1]}",
@@ -504,6 +926,23 @@ class SemanticEngine:
                         entities_to_include=concepts
                     ))
 
+        # No exact key: nearest pre-defined bridge by embedding similarity
+        if not suggestions:
+            match = self._fuzzy_bridge(self.fuzzy_bridge_pairs(publisher, target))
+            if match:
+                key, (pub_topic, tgt_word), score = match
+                concepts = self.VERTICAL_BRIDGES[key]
+                suggestions.append(BridgeSuggestion(
+                    concept=" → ".join(concepts),
+                    rationale=f"Publisher ({pub_topic}) och target ({tgt_word}) liknar {key[0]}/{key[1]}, kopplas via {concepts[1]}",
+                    confidence=BridgeConfidence.MEDIUM,
+                    confidence_score=round(0.85 * score, 2),
+                    publisher_relevance=0.8,
+                    target_relevance=0.7,
+                    suggested_angle=f"Hur {concepts[1]} formar {pub_topic}",
+                    entities_to_include=concepts
+                ))
+
         # Fallback: intersect-based bridge
         if not suggestions:
             pub_set = set(w.lower() for w in publisher.primary_topics)
@@ -536,11 +975,12 @@ class SemanticEngine:
 
         return suggestions[:3]
 
-    def _forbidden_entities(self, target: TargetFingerprint) -> List[str]:
+    def _forbidden_entities(self, target: TargetFingerprint,
+                            url_lower: Optional[str] = None) -> List[str]:
         """Entities to avoid based on target vertical."""
-        url_lower = target.url.lower()
+        url_lower = url_lower or target.url.lower()
         forbidden = []
-        if any(w in url_lower for w in ["casino", "betting", "spel", "odds"]):
+        if _RE_GAMBLING.search(url_lower):
             forbidden.extend(["spelinspektionen", "spelpaus", "spelansvar",
                             "spelmissbruk", "spelberoende", "stödlinjen"])
         return forbidden
@@ -549,14 +989,13 @@ class SemanticEngine:
         """Topics to base trust links on (article topic, NOT target vertical)."""
         return pub.primary_topics[:3] + ["statistik", "forskning"]
 
-    def _trust_link_avoid(self, target: TargetFingerprint) -> List[str]:
+    def _trust_link_avoid(self, target: TargetFingerprint,
+                          url_lower: Optional[str] = None) -> List[str]:
         """Domains to never use as trust links."""
-        avoid = []
-        target_domain = urlparse(target.url).netloc.replace("www.", "")
-        avoid.append(target_domain)
+        avoid = [_netloc(target.url)]
 
-        url_lower = target.url.lower()
-        if any(w in url_lower for w in ["casino", "betting", "spel"]):
+        url_lower = url_lower or target.url.lower()
+        if _RE_CASINO.search(url_lower):
             avoid.extend(["bettingstugan.se", "casinon.com", "casinostugan.se",
                          "spelbolagen.se", "casinoutansvensklicens.com"])
         return avoid
@@ -566,6 +1005,11 @@ class SemanticEngine:
 # LANGUAGE DETECTOR
 # ============================================================
 
+_EN_SIGNALS = ("weekly", "town", "kingdom", "blog", "news",
+               "world", "daily", "times", "online", "hub")
+
+
+@functools.lru_cache(maxsize=4096)
 def detect_language(domain: str) -> str:
     """Detect article language from publisher domain.
     Heuristic: .co.uk/.uk/.com with English-pattern words → en, else sv.
@@ -577,9 +1021,7 @@ def detect_language(domain: str) -> str:
     # Common English-only TLDs with English domain words
     if domain.endswith(".com"):
         name = domain.split(".")[0]
-        english_signals = ["weekly", "town", "kingdom", "blog", "news",
-                           "world", "daily", "times", "online", "hub"]
-        if any(sig in name for sig in english_signals):
+        if any(sig in name for sig in _EN_SIGNALS):
             return "en"
     return "sv"
 
@@ -597,8 +1039,7 @@ def assess_risk(bridge: SemanticBridge, target: TargetFingerprint) -> RiskLevel:
 
     # YMYL check
     url_lower = target.url.lower()
-    ymyl_patterns = ["hälsa", "health", "medicin", "medicine", "juridik", "legal"]
-    if any(p in url_lower for p in ymyl_patterns):
+    if _RE_YMYL.search(url_lower):
         return RiskLevel.HIGH
 
     return RiskLevel.LOW
@@ -619,10 +1060,11 @@ class PromptGenerator:
         # Build source info if available
         sources_section = ""
         if preflight.sources and preflight.sources.verified_sources:
-            sources_section = "\n\n### VERIFIERADE KÄLLOR (använd dessa som trustlänkar)\n"
+            parts = ["\n\n### VERIFIERADE KÄLLOR (använd dessa som trustlänkar)\n"]
             for s in preflight.sources.verified_sources:
                 facts = "; ".join(s.extracted_facts[:3])
-                sources_section += f"- **{s.domain}**: [{facts}]({s.url})\n"
+                parts.append(f"- **{s.domain}**: [{facts}]({s.url})\n")
+            sources_section = "".join(parts)
 
         # Build semantic context
         semantic_section = ""
@@ -717,47 +1159,110 @@ class Pipeline:
         self.target_analyzer = TargetAnalyzer(config)
         self.semantic_engine = SemanticEngine(config)
         self.prompt_generator = PromptGenerator()
+        # Load the embedding model while publisher/target fetches are in flight
+        if EMBEDDINGS_AVAILABLE:
+            threading.Thread(target=self.semantic_engine._get_model, daemon=True).start()
 
-    def load_jobs(self, csv_path: Optional[str] = None) -> List[JobSpec]:
-        """Load job list from CSV."""
+    def iter_jobs(self, csv_path: Optional[str] = None) -> Iterator[JobSpec]:
+        """Yield jobs from CSV one row at a time."""
         path = Path(csv_path or self.config.csv_path)
         if not path.exists():
             print(f"ERROR: CSV not found: {path}")
             sys.exit(1)
 
-        jobs = []
         with open(path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for row in reader:
-                jobs.append(JobSpec(
+                yield JobSpec(
                     job_number=int(row["job_number"]),
                     publisher_domain=row["publication_domain"].strip(),
                     target_url=row["target_page"].strip(),
                     anchor_text=row["anchor_text"].strip()
-                ))
+                )
 
-        print(f"Loaded {len(jobs)} jobs from {path.name}")
+    def load_jobs(self, csv_path: Optional[str] = None) -> List[JobSpec]:
+        """Load job list from CSV."""
+        jobs = list(self.iter_jobs(csv_path))
+        print(f"Loaded {len(jobs)} jobs from {Path(csv_path or self.config.csv_path).name}")
         return jobs
 
     async def run_preflight(self, job: JobSpec) -> Preflight:
         """Run preflight analysis for a single job."""
+        publisher, target = await self.analyze_job(job)
+        return self.build_preflight(job, publisher, target)
+
+    async def _analyze_all(self, jobs: List[JobSpec]):
+        """analyze_job for every job, at most config.concurrency at a time."""
+        sem = asyncio.Semaphore(self.config.concurrency)
+
+        async def bounded(job: JobSpec):
+            async with sem:
+                return await self.analyze_job(job)
+
+        return await asyncio.gather(*(bounded(j) for j in jobs))
+
+    async def _warm_connections(self, session: "aiohttp.ClientSession", jobs: List[JobSpec]):
+        """Resolve DNS and open TLS connections to every uncached host up front.
+
+        All handshakes happen concurrently, so the per-job GETs start on
+        pooled keep-alive connections instead of paying setup one by one.
+        """
+        origins = set()
+        for job in jobs:
+            if not self.publisher_profiler.is_cached(job.publisher_domain):
+                origins.add(f"https://{PublisherProfiler.normalize_domain(job.publisher_domain)}")
+            if not self.target_analyzer.is_cached(job.target_url):
+                parts = urlparse(job.target_url)
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        if not origins:
+            return
+
+        timeout = aiohttp.ClientTimeout(total=5)
+
+        async def touch(origin: str):
+            try:
+                async with session.head(origin, allow_redirects=False, timeout=timeout):
+                    pass
+            except Exception:
+                pass
+
+        print(f"Warming connections to {len(origins)} host(s)...")
+        await asyncio.gather(*(touch(o) for o in origins))
+
+    async def analyze_job(self, job: JobSpec) -> Tuple[PublisherProfile, TargetFingerprint]:
+        """Fetch publisher profile and target fingerprint for a single job."""
+        # Publisher and target fetches are independent — run them together
+        publisher, target = await asyncio.gather(
+            self.publisher_profiler.analyze(job.publisher_domain),
+            self.target_analyzer.analyze(job.target_url),
+        )
+
         print(f"\n{'='*60}")
         print(f"JOB {job.job_number}: {job.publisher_domain} → {job.anchor_text}")
         print(f"{'='*60}")
-
-        # Publisher analysis
         print(f"  [1/3] Publisher: {job.publisher_domain}")
-        publisher = await self.publisher_profiler.analyze(job.publisher_domain)
         print(f"        Topics: {publisher.primary_topics}")
-
-        # Target analysis
         print(f"  [2/3] Target: {job.target_url[:60]}...")
-        target = await self.target_analyzer.analyze(job.target_url)
         print(f"        Keywords: {target.main_keywords[:5]}")
 
+        return publisher, target
+
+    def build_preflight(
+        self, job: JobSpec, publisher: PublisherProfile, target: TargetFingerprint,
+        raw_distance: Optional[float] = None
+    ) -> Preflight:
+        """Semantic bridge, language and risk for an analyzed job.
+
+        Pass the precomputed publisher/target similarity to skip encoding.
+        """
         # Semantic bridge
-        print(f"  [3/3] Semantic analysis...")
-        bridge = self.semantic_engine.analyze(publisher, target, job.anchor_text)
+        print(f"  [3/3] Job {job.job_number}: semantic analysis...")
+        if raw_distance is not None:
+            bridge = self.semantic_engine.analyze_with_distance(
+                publisher, target, job.anchor_text, raw_distance
+            )
+        else:
+            bridge = self.semantic_engine.analyze(publisher, target, job.anchor_text)
         print(f"        Distance: {bridge.distance_category.value} ({bridge.raw_distance:.3f})")
         print(f"        Angle: {bridge.recommended_angle}")
 
@@ -783,7 +1288,7 @@ class Pipeline:
         preflight_dir.mkdir(parents=True, exist_ok=True)
 
         path = preflight_dir / f"preflight_{preflight.job.job_number:03d}.json"
-        path.write_text(preflight.to_json(), encoding="utf-8")
+        path.write_bytes(preflight.to_json().encode("utf-8"))
         print(f"  Saved: {path.name}")
 
     def save_prompt(self, preflight: Preflight):
@@ -793,12 +1298,12 @@ class Pipeline:
 
         prompt = self.prompt_generator.generate(preflight)
         path = prompts_dir / f"prompt_{preflight.job.job_number:03d}.md"
-        path.write_text(prompt, encoding="utf-8")
+        path.write_bytes(prompt.encode("utf-8"))
         print(f"  Saved: {path.name}")
 
     async def run(
         self,
-        jobs: Optional[List[JobSpec]] = None,
+        jobs: Optional[Iterable[JobSpec]] = None,
         csv_path: Optional[str] = None,
         job_number: Optional[int] = None,
         start: Optional[int] = None,
@@ -807,15 +1312,18 @@ class Pipeline:
     ):
         """Run the full pipeline."""
         if jobs is None:
-            jobs = self.load_jobs(csv_path)
+            jobs = self.iter_jobs(csv_path)
 
-        # Filter
+        # Filter while reading — rows outside the selection are never kept
         if job_number is not None:
-            jobs = [j for j in jobs if j.job_number == job_number]
+            match = next((j for j in jobs if j.job_number == job_number), None)
+            jobs = [match] if match else []
         elif start is not None or end is not None:
             s = start or 1
             e = end or 999
             jobs = [j for j in jobs if s <= j.job_number <= e]
+        else:
+            jobs = list(jobs)
 
         if not jobs:
             print("No jobs to process.")
@@ -824,20 +1332,56 @@ class Pipeline:
         print(f"\nProcessing {len(jobs)} job(s)...")
         t0 = time.time()
 
+        if HTTP_AVAILABLE:
+            async with create_session(self.config) as session:
+                self.publisher_profiler.session = session
+                self.target_analyzer.session = session
+                try:
+                    await self._warm_connections(session, jobs)
+                    analyses = await self._analyze_all(jobs)
+                finally:
+                    self.publisher_profiler.session = None
+                    self.target_analyzer.session = None
+        else:
+            analyses = await self._analyze_all(jobs)
+
+        # Identical / near-identical text pairs need no embedding at all
+        engine = self.semantic_engine
+        pairs = [engine.bridge_texts(publisher, target) for publisher, target in analyses]
+        distances = [engine.text_overlap_similarity(*pair) for pair in pairs]
+        pending = [i for i, d in enumerate(distances) if d is None]
+
+        # Embed the remaining publisher/target texts in one batched model call
+        if pending:
+            embeddings = engine.encode_batch([t for i in pending for t in pairs[i]])
+            if embeddings is not None:
+                # All publisher/target cosines in one vectorized pass
+                sims = engine.pair_similarities(embeddings[0::2], embeddings[1::2]).tolist()
+                for i, sim in zip(pending, sims):
+                    distances[i] = sim
+                # Fuzzy-bridge queries for those jobs, also in one model call
+                engine.encode_bridge_pairs(
+                    pair for i in pending for pair in engine.fuzzy_bridge_pairs(*analyses[i])
+                )
+
         all_preflights = []
-        for job in jobs:
-            preflight = await self.run_preflight(job)
+        for job, (publisher, target), raw_distance in zip(jobs, analyses, distances):
+            preflight = self.build_preflight(job, publisher, target, raw_distance)
             self.save_preflight(preflight)
             self.save_prompt(preflight)
             all_preflights.append(preflight)
 
         # Save combined preflights
         combined_path = Path(self.config.output_dir) / "all_preflights.json"
-        combined = [json.loads(p.to_json()) for p in all_preflights]
-        combined_path.write_text(
-            json.dumps(combined, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        # Each to_json() is already a complete JSON document — stream them
+        # into an array one at a time, never holding the whole file in memory
+        with open(combined_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            f.write("[\n")
+            for i, p in enumerate(all_preflights):
+                if i:
+                    f.write(",\n")
+                f.write(p.to_json())
+            f.write("\n]")
 
         elapsed = time.time() - t0
         print(f"\n{'='*60}")
@@ -852,19 +1396,30 @@ class Pipeline:
 # Agenten kan köra dessa individuellt med valfria parametrar.
 # Varje tool tar input, gör EN sak, returnerar JSON.
 
+_DEFAULT_ENGINE: Optional[SemanticEngine] = None
+
+
+def _get_default_engine() -> SemanticEngine:
+    """Process-wide SemanticEngine for tool calls, so the model loads only once."""
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        _DEFAULT_ENGINE = SemanticEngine(PipelineConfig())
+    return _DEFAULT_ENGINE
+
+
 async def tool_profile_publisher(domain: str, config: PipelineConfig = None) -> str:
     """Profile a publisher domain. Returns JSON."""
     config = config or PipelineConfig()
     profiler = PublisherProfiler(config)
     result = await profiler.analyze(domain)
-    return json.dumps({
+    return _json_dumps({
         "domain": result.domain,
         "site_name": result.site_name,
         "topics": result.primary_topics,
         "language": result.primary_language,
         "categories": result.category_structure,
         "confidence": result.confidence
-    }, ensure_ascii=False, indent=2)
+    }).decode("utf-8")
 
 
 async def tool_analyze_target(url: str, config: PipelineConfig = None) -> str:
@@ -872,7 +1427,7 @@ async def tool_analyze_target(url: str, config: PipelineConfig = None) -> str:
     config = config or PipelineConfig()
     analyzer = TargetAnalyzer(config)
     result = await analyzer.analyze(url)
-    return json.dumps({
+    return _json_dumps({
         "url": result.url,
         "title": result.title,
         "h1": result.h1,
@@ -880,7 +1435,7 @@ async def tool_analyze_target(url: str, config: PipelineConfig = None) -> str:
         "language": result.language,
         "keywords": result.main_keywords[:15],
         "topic_cluster": result.topic_cluster[:10]
-    }, ensure_ascii=False, indent=2)
+    }).decode("utf-8")
 
 
 def tool_semantic_distance(
@@ -890,8 +1445,7 @@ def tool_semantic_distance(
     config: PipelineConfig = None
 ) -> str:
     """Calculate semantic distance between publisher and target. Returns JSON."""
-    config = config or PipelineConfig()
-    engine = SemanticEngine(config)
+    engine = _get_default_engine() if config is None else SemanticEngine(config)
 
     pub = PublisherProfile(
         domain="input", timestamp=datetime.now(),
@@ -902,7 +1456,7 @@ def tool_semantic_distance(
         main_keywords=target_keywords
     )
     bridge = engine.analyze(pub, tgt, anchor_text)
-    return json.dumps({
+    return _json_dumps({
         "distance": round(bridge.raw_distance, 3),
         "category": bridge.distance_category.value,
         "recommended_angle": bridge.recommended_angle,
@@ -913,7 +1467,7 @@ def tool_semantic_distance(
         "required_entities": bridge.required_entities,
         "forbidden_entities": bridge.forbidden_entities,
         "trust_link_topics": bridge.trust_link_topics
-    }, ensure_ascii=False, indent=2)
+    }).decode("utf-8")
 
 
 # ============================================================
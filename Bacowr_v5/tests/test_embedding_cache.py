@@ -0,0 +1,20 @@
+"""Tests for the on-disk embedding cache."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+import pipeline
+
+
+def test_flat_layout_entry_is_moved_into_its_shard(tmp_path):
+    cache = pipeline.EmbeddingCache(pipeline.PipelineConfig(output_dir=str(tmp_path)))
+    vec = np.arange(8, dtype=np.int8)
+    np.save(cache._flat_path("hej"), vec)
+
+    assert np.array_equal(cache.get("hej"), vec)
+    assert not cache._flat_path("hej").exists()
+    assert np.array_equal(np.load(cache._path("hej")), vec)
+    assert cache.get("saknas") is None
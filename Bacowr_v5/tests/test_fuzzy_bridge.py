@@ -0,0 +1,62 @@
+"""Tests for the embedding fallback to VERTICAL_BRIDGES keys."""
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+import pipeline
+from models import PublisherProfile, SemanticDistance, TargetFingerprint
+
+
+class _FakeModel:
+    """Deterministic unit vectors; "sportnytt kasino" is made to sit next to "sport casino"."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        out = []
+        for t in texts:
+            seed = zlib.crc32(("sport casino" if t == "sportnytt kasino" else t).encode())
+            v = np.random.default_rng(seed).normal(size=16)
+            out.append(v / np.linalg.norm(v))
+        return np.array(out)
+
+
+def _engine(tmp_path):
+    return pipeline.SemanticEngine(pipeline.PipelineConfig(output_dir=str(tmp_path)))
+
+
+def _pair():
+    publisher = PublisherProfile(domain="x.se", timestamp=datetime.now(), primary_topics=["sportnytt"])
+    target = TargetFingerprint(url="https://y.se/", timestamp=datetime.now(), main_keywords=["kasino"])
+    return publisher, target
+
+
+def test_fuzzy_bridge_uses_pre_encoded_pairs_without_disk_cache(tmp_path):
+    engine = _engine(tmp_path)
+    engine._model = model = _FakeModel()
+    publisher, target = _pair()
+
+    engine.encode_bridge_pairs(engine.fuzzy_bridge_pairs(publisher, target))
+    bridges = engine._generate_bridges(publisher, target, "anchor", SemanticDistance.DISTANT)
+
+    assert model.calls[0] == ["sportnytt kasino"]
+    assert bridges[0].entities_to_include == engine.VERTICAL_BRIDGES[("sport", "casino")]
+    # Only the bridge keys go to the disk cache, never the one-off pair queries
+    assert len(list((tmp_path / ".cache" / "emb").rglob("*.npy"))) == len(engine.VERTICAL_BRIDGES)
+
+
+def test_fuzzy_bridge_is_skipped_without_a_loaded_model(tmp_path):
+    engine = _engine(tmp_path)
+    publisher, target = _pair()
+
+    engine.encode_bridge_pairs(engine.fuzzy_bridge_pairs(publisher, target))
+    bridges = engine._generate_bridges(publisher, target, "anchor", SemanticDistance.DISTANT)
+
+    assert all(b.confidence != pipeline.BridgeConfidence.MEDIUM for b in bridges)
@@ -0,0 +1,75 @@
+"""Tests for capped HTML body reads."""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import pipeline
+
+
+async def _chunked_page(request):
+    """Stream a ~100 KB page in small chunks; the <h1> arrives long after the first one."""
+    resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+    await resp.prepare(request)
+    await resp.write(b"<html><head><title>Start</title></head><body>")
+    for _ in range(100):
+        await resp.write(b"<p>" + b"x" * 1000 + b"</p>")
+        await asyncio.sleep(0)
+    await resp.write(b"<h1>Late heading</h1></body></html>")
+    await resp.write_eof()
+    return resp
+
+
+async def _fetch(limit):
+    app = web.Application()
+    app.router.add_get("/", _chunked_page)
+    async with TestServer(app) as server:
+        async with pipeline.create_session(pipeline.PipelineConfig()) as session:
+            async with session.get(server.make_url("/")) as resp:
+                return await pipeline._read_html(resp, limit)
+
+
+def test_read_html_reads_past_first_chunk(tmp_path):
+    html = asyncio.run(_fetch(262_144))
+    analyzer = pipeline.TargetAnalyzer(pipeline.PipelineConfig(output_dir=str(tmp_path)))
+    assert html.endswith("<h1>Late heading</h1></body></html>")
+    assert analyzer._parse_html("https://x.se/", html).h1 == "Late heading"
+
+
+def test_read_html_stops_at_limit():
+    html = asyncio.run(_fetch(50_000))
+    assert len(html) == 50_000
+    assert html.startswith("<html><head><title>Start</title>")
+
+
+async def _chunked_homepage(request):
+    """Homepage whose <nav> only arrives after several KB of <head> in separate writes."""
+    resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+    await resp.prepare(request)
+    await resp.write(b'<html lang="sv"><head><title>Exempelbladet | Nyheter</title>')
+    for _ in range(20):
+        await resp.write(b"<script>" + b"y" * 1000 + b"</script>")
+        await asyncio.sleep(0)
+    await resp.write(b'</head><body><nav><a href="/sport">Sport</a><a href="/ekonomi">Ekonomi</a></nav>')
+    await resp.write(b"<footer><nav><a href='/om'>Om oss</a></nav></footer></body></html>")
+    await resp.write_eof()
+    return resp
+
+
+async def _profile_homepage(output_dir):
+    app = web.Application()
+    app.router.add_get("/", _chunked_homepage)
+    async with TestServer(app) as server:
+        async with pipeline.create_session(pipeline.PipelineConfig()) as session:
+            profiler = pipeline.PublisherProfiler(pipeline.PipelineConfig(output_dir=str(output_dir)), session=session)
+            return await profiler._quick_homepage(str(server.make_url("/")))
+
+
+def test_quick_homepage_reads_nav_past_first_chunk(tmp_path):
+    home = asyncio.run(_profile_homepage(tmp_path))
+    assert home["site_name"] == "Exempelbladet"
+    assert home["categories"] == ["Sport", "Ekonomi"]
@@ -5,6 +5,7 @@ No API keys needed — runs in full offline mode.
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
 from synapse_engine import run_pipeline
@@ -15,20 +16,15 @@ DEMO_SEEDS = [
     {"seed": "privatlån upp till 800 000", "slug": "demo-loan", "target": 30},
 ]
 
+# The viewer's built-in sample graph, swapped for the real one in a single pass
+_SAMPLE_RE = re.compile(r"(const sample =).*?(;\n\nconst svg)", re.S)
+
 
 def embed_viewer(graph: dict, viewer_src: Path) -> str:
     """Create a self-contained viewer HTML with the graph embedded."""
     html = viewer_src.read_text(encoding="utf-8")
-    marker = "const sample ="
-    start = html.find(marker)
-    if start != -1:
-        end = html.find(";\n\nconst svg", start)
-        if end != -1:
-            prefix = html[: start + len(marker)]
-            suffix = html[end:]
-            embedded = " " + json.dumps(graph, ensure_ascii=False)
-            html = prefix + embedded + suffix
-    return html
+    embedded = " " + json.dumps(graph, ensure_ascii=False)
+    return _SAMPLE_RE.sub(lambda m: m.group(1) + embedded + m.group(2), html, count=1)
 
 
 def main() -> None:
@@ -54,17 +50,17 @@ def main() -> None:
         )
 
         # Save artifacts
-        (artifacts_dir / f"{slug}.json").write_text(
-            json.dumps(graph, ensure_ascii=False, indent=2), encoding="utf-8"
+        (artifacts_dir / f"{slug}.json").write_bytes(
+            json.dumps(graph, ensure_ascii=False, indent=2).encode("utf-8")
         )
-        (artifacts_dir / f"{slug}-related.json").write_text(
-            json.dumps(related, ensure_ascii=False, indent=2), encoding="utf-8"
+        (artifacts_dir / f"{slug}-related.json").write_bytes(
+            json.dumps(related, ensure_ascii=False, indent=2).encode("utf-8")
         )
 
         # Self-contained viewer
         if viewer_src.exists():
             html = embed_viewer(graph, viewer_src)
-            (artifacts_dir / f"{slug}-viewer.html").write_text(html, encoding="utf-8")
+            (artifacts_dir / f"{slug}-viewer.html").write_bytes(html.encode("utf-8"))
 
         n_nodes = len(graph.get("nodes", []))
         n_clusters = len(graph.get("clusters", []))
@@ -79,15 +75,15 @@ def main() -> None:
         seed_phrase="privatlån upp till 800 000",
         language="sv", market="SE", spec_root=spec_root, target=50,
     )
-    (out_dir / "GraphArtifact.json").write_text(
-        json.dumps(graph, ensure_ascii=False, indent=2), encoding="utf-8"
+    (out_dir / "GraphArtifact.json").write_bytes(
+        json.dumps(graph, ensure_ascii=False, indent=2).encode("utf-8")
     )
-    (out_dir / "RelatedQueriesOutput.json").write_text(
-        json.dumps(related, ensure_ascii=False, indent=2), encoding="utf-8"
+    (out_dir / "RelatedQueriesOutput.json").write_bytes(
+        json.dumps(related, ensure_ascii=False, indent=2).encode("utf-8")
     )
     if viewer_src.exists():
         html = embed_viewer(graph, viewer_src)
-        (out_dir / "viewer.html").write_text(html, encoding="utf-8")
+        (out_dir / "viewer.html").write_bytes(html.encode("utf-8"))
 
     print(f"\nDone. Artifacts in: {artifacts_dir}")
     print(f"Legacy output in: {out_dir}")
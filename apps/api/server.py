@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -18,21 +20,27 @@ from synapse_engine.providers import Budget, Runtime, Secrets, load_secrets, sav
 ROOT = Path(__file__).resolve().parent
 SPEC_ROOT = ROOT / "spec"
 STATIC_DIR = ROOT / "static"
+# Resolved once at import; None when the UI was not shipped with this checkout
+_INDEX_PATH: Optional[Path] = STATIC_DIR / "index.html"
+if not _INDEX_PATH.is_file():
+    _INDEX_PATH = None
+
+
+# Keep simple; user can override in UI.
+_MARKET_TO_LOCATION = MappingProxyType({
+    "SE": "Sweden",
+    "US": "United States",
+    "UK": "United Kingdom",
+    "GB": "United Kingdom",
+    "DE": "Germany",
+    "NO": "Norway",
+    "DK": "Denmark",
+    "FI": "Finland",
+})
 
 
 def _default_location_name(market: str) -> str:
-    # Keep simple; user can override in UI.
-    m = (market or "").upper().strip()
-    return {
-        "SE": "Sweden",
-        "US": "United States",
-        "UK": "United Kingdom",
-        "GB": "United Kingdom",
-        "DE": "Germany",
-        "NO": "Norway",
-        "DK": "Denmark",
-        "FI": "Finland",
-    }.get(m, "Sweden")
+    return _MARKET_TO_LOCATION.get(market.upper().strip() if market else "", "Sweden")
 
 
 class BudgetIn(BaseModel):
@@ -42,12 +50,11 @@ class BudgetIn(BaseModel):
     serp_depth: Optional[int] = None
     serp_refine_top_n: Optional[int] = None
     serp_calls_max: Optional[int] = None
+    serp_concurrency: Optional[int] = None
 
     def to_budget(self) -> Budget:
-        b = Budget()
-        for k, v in self.model_dump(exclude_none=True).items():
-            setattr(b, k, v)
-        return b
+        # Field names mirror Budget; unset ones fall back to Budget's defaults.
+        return Budget(**{k: v for k, v in self.__dict__.items() if v is not None})
 
 
 class SecretsIn(BaseModel):
@@ -62,7 +69,8 @@ class SecretsIn(BaseModel):
     gemini_api_key: Optional[str] = Field(default=None)
 
     def to_secrets(self) -> Secrets:
-        return Secrets.from_dict(self.model_dump(exclude_none=True))
+        # Fields are already validated plain strings; no need for a model_dump pass.
+        return Secrets.from_dict({k: v for k, v in self.__dict__.items() if v is not None})
 
 
 class RunRequest(BaseModel):
@@ -102,11 +110,10 @@ app.add_middleware(
 
 
 @app.get("/")
-def index() -> FileResponse:
-    p = STATIC_DIR / "index.html"
-    if not p.exists():
+async def index() -> FileResponse:
+    if _INDEX_PATH is None:
         raise HTTPException(status_code=500, detail="UI missing: static/index.html")
-    return FileResponse(str(p))
+    return FileResponse(_INDEX_PATH, headers={"Cache-Control": "public, max-age=300"})
 
 
 @app.get("/api/secrets/status")
@@ -124,8 +131,8 @@ def secrets_save(payload: SecretsIn) -> Dict[str, Any]:
     return {"ok": True, "redacted": merged.redacted()}
 
 
-@app.post("/api/run", response_model=RunResponse)
-def run(req: RunRequest) -> RunResponse:
+def _run_job(req: RunRequest) -> RunResponse:
+    """Blocking part of /api/run: secrets file IO, provider calls and the CPU-bound pipeline."""
     # Merge: env + persisted + request payload (highest precedence)
     secrets = Secrets.from_env().merge(load_secrets())
     if req.secrets is not None:
@@ -154,7 +161,17 @@ def run(req: RunRequest) -> RunResponse:
         runtime=runtime,
     )
 
-    return RunResponse(job_id=job_id, graph=graph, related=related, secrets_status=secrets.redacted())
+    # Pipeline output is built by our own code: skip re-validating the large graph dicts.
+    # FastAPI serializes the returned model through response_model with pydantic.
+    return RunResponse.model_construct(
+        job_id=job_id, graph=graph, related=related, secrets_status=secrets.redacted()
+    )
+
+
+@app.post("/api/run", response_model=RunResponse)
+async def run(req: RunRequest) -> RunResponse:
+    # Run in a worker thread so the event loop keeps serving other requests meanwhile.
+    return await asyncio.to_thread(_run_job, req)
 
 
 # Static assets (optional)
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .utils import content_tokens
+from .utils import content_tokens, fetch_concurrently
 
 from .runtime import Runtime
 from .providers.dataforseo import parse_keyword_suggestions
 from .providers.ahrefs import parse_matching_terms
 
 
-@dataclass
+# Seed parsing patterns, compiled once at import
+_AMOUNT_RE = re.compile(r"\d{1,3}(?:[\s.,]\d{3})+|\d+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@dataclass(slots=True)
 class Candidate:
     phrase: str
     provenance: str
@@ -25,7 +31,7 @@ def _extract_amount(seed_phrase: str) -> Optional[str]:
     Returns a display-like string (keeps spaces) if present.
     """
     # Match numbers with optional thousand separators
-    m = re.findall(r"\d{1,3}(?:[\s.,]\d{3})+|\d+", seed_phrase)
+    m = _AMOUNT_RE.findall(seed_phrase)
     if not m:
         return None
     # pick the longest
@@ -36,7 +42,7 @@ def _extract_amount(seed_phrase: str) -> Optional[str]:
 def _extract_topic(seed_phrase: str) -> str:
     toks = content_tokens(seed_phrase)
     # drop pure numbers
-    toks = [t for t in toks if not re.fullmatch(r"\d+", t)]
+    toks = [t for t in toks if not _DIGITS_RE.fullmatch(t)]
     if not toks:
         return seed_phrase.strip().lower()
     # keep at most 2 tokens to avoid long templates
@@ -49,7 +55,7 @@ def generate_candidates(
     market: str,
     target_pool: int = 300,
     runtime: Optional[Runtime] = None,
-    seed_serp_snapshot: Optional[Dict[str, Any]] = None,
+    seed_serp_snapshot: Optional[Dict[str, Any]] | Callable[[], Optional[Dict[str, Any]]] = None,
 ) -> List[Candidate]:
     """Generate a candidate pool.
 
@@ -59,6 +65,9 @@ def generate_candidates(
 
     We *still* add a small template expansion to guarantee diversity + reach the
     desired pool size with a predictable budget.
+
+    `seed_serp_snapshot` may also be a callable returning the snapshot; it is called
+    only after the provider requests, so a seed SERP fetch can overlap them.
     """
     topic = _extract_topic(seed_phrase)
     amount = _extract_amount(seed_phrase)
@@ -117,112 +126,98 @@ def generate_candidates(
     brand_pairs = [("sbab", "nordea"), ("ica banken", "seb"), ("handelsbanken", "swedbank")]
     advisor_templates += [f"{b1} vs {b2} {topic}" for b1, b2 in brand_pairs]
 
-    def fmt(tpl: str) -> str:
-        a = f" {amount}" if (amount and "{amount}" in tpl) else ""
-        return tpl.format(topic=topic, amount=a, year=year)
+    # One substitution map for every template (unused keys are simply ignored)
+    ctx = {"topic": topic, "amount": f" {amount}" if amount else "", "year": year}
 
+    # Dedup as we go (case-insensitive, whitespace-collapsed); the seed itself is never a candidate
     candidates: List[Candidate] = []
+    seen = {" ".join(seed_phrase.lower().split())}
+
+    def _add(phrase: str, provenance: str, rationale: str, metrics: Optional[Dict[str, Any]] = None) -> None:
+        k = " ".join(phrase.lower().split())
+        if not k or k in seen:
+            return
+        seen.add(k)
+        candidates.append(Candidate(phrase=k, provenance=provenance, rationale=rationale, metrics=metrics))
 
     # -------------------------
     # Provider-backed candidates
     # -------------------------
     if runtime is not None:
-        # DataForSEO Labs (keyword suggestions = long-tail candidates + metrics)
-        if runtime.providers.dataforseo is not None:
-            try:
-                resp = runtime.providers.dataforseo.keyword_suggestions(
-                    seed=seed_phrase,
-                    location_name=runtime.location_name,
-                    location_code=runtime.location_code,
-                    language_code=runtime.language_code,
-                    limit=runtime.budget.keyword_suggestions_limit,
-                    include_seed_keyword=False,
-                )
-                for row in parse_keyword_suggestions(resp):
-                    kw = row.get("keyword")
-                    if not kw:
-                        continue
-                    candidates.append(
-                        Candidate(
-                            phrase=str(kw),
-                            provenance="ads_api",
-                            rationale="DataForSEO Labs: keyword_suggestions",
-                            metrics=row,
-                        )
-                    )
-            except Exception:
-                # Provider failures should never kill the run.
-                pass
-
-            try:
-                resp = runtime.providers.dataforseo.related_keywords(
-                    seed=seed_phrase,
-                    location_name=runtime.location_name,
-                    location_code=runtime.location_code,
-                    language_code=runtime.language_code,
-                    limit=runtime.budget.related_keywords_limit,
-                    include_seed_keyword=False,
-                )
-                for row in parse_keyword_suggestions(resp):
-                    kw = row.get("keyword")
-                    if not kw:
-                        continue
-                    candidates.append(
-                        Candidate(
-                            phrase=str(kw),
-                            provenance="serp_related",
-                            rationale="DataForSEO Labs: related_keywords (SERP-related)",
-                            metrics=row,
-                        )
-                    )
-            except Exception:
-                pass
+        dfs = runtime.providers.dataforseo
+        ahrefs = runtime.providers.ahrefs
+        budget = runtime.budget
+
+        # (call, parser, provenance, rationale) — independent requests, fanned out below
+        calls: List[Tuple[Callable[[], Dict[str, Any]], Callable, str, str]] = []
+        if dfs is not None:
+            # DataForSEO Labs (keyword suggestions = long-tail candidates + metrics)
+            locale = dict(
+                location_name=runtime.location_name,
+                location_code=runtime.location_code,
+                language_code=runtime.language_code,
+            )
+            calls.append((
+                partial(dfs.keyword_suggestions, seed=seed_phrase, limit=budget.keyword_suggestions_limit,
+                        include_seed_keyword=False, **locale),
+                parse_keyword_suggestions, "ads_api", "DataForSEO Labs: keyword_suggestions",
+            ))
+            calls.append((
+                partial(dfs.related_keywords, seed=seed_phrase, limit=budget.related_keywords_limit,
+                        include_seed_keyword=False, **locale),
+                parse_keyword_suggestions, "serp_related", "DataForSEO Labs: related_keywords (SERP-related)",
+            ))
 
         # Ahrefs (matching terms)
-        if runtime.providers.ahrefs is not None:
+        if ahrefs is not None:
+            calls.append((
+                partial(ahrefs.keywords_matching_terms, [seed_phrase], limit=1000),
+                parse_matching_terms, "ads_api", "Ahrefs v3: keywords_matching_terms",
+            ))
+
+        responses = fetch_concurrently([c[0] for c in calls])
+        for (_, parse, provenance, rationale), resp in zip(calls, responses):
+            # Provider failures should never kill the run.
+            if resp is None:
+                continue
             try:
-                resp = runtime.providers.ahrefs.keywords_matching_terms([seed_phrase], limit=1000)
-                for row in parse_matching_terms(resp):
+                for row in parse(resp):
                     kw = row.get("keyword")
                     if not kw:
                         continue
-                    candidates.append(
-                        Candidate(
-                            phrase=str(kw),
-                            provenance="ads_api",
-                            rationale="Ahrefs v3: keywords_matching_terms",
-                            metrics=row,
-                        )
-                    )
+                    _add(str(kw), provenance, rationale, row)
             except Exception:
                 pass
 
         # Seed SERP expansion (PAA + related searches)
+        if callable(seed_serp_snapshot):
+            seed_serp_snapshot = seed_serp_snapshot()
         if seed_serp_snapshot:
             for q in seed_serp_snapshot.get("paa", []) or []:
-                candidates.append(Candidate(phrase=str(q), provenance="serp_paa", rationale="Seed SERP: People Also Ask"))
+                _add(str(q), "serp_paa", "Seed SERP: People Also Ask")
             for q in seed_serp_snapshot.get("related", []) or []:
-                candidates.append(Candidate(phrase=str(q), provenance="serp_related", rationale="Seed SERP: Related searches"))
+                _add(str(q), "serp_related", "Seed SERP: Related searches")
 
     # -------------------------
     # Offline-friendly backfill
     # -------------------------
     if runtime is None:
         # In fully offline mode: keep the existing behaviour (pure template pool)
-        for tpl in provider_templates:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template expansion (provider/transactional)."))
-        for tpl in advisor_templates:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template expansion (advisor/commercial)."))
-        for tpl in seeker_templates:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template expansion (seeker/informational)."))
-        for tpl in regulator_templates:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template expansion (regulator/informational)."))
+        template_groups = [
+            (provider_templates, "Template expansion (provider/transactional)."),
+            (advisor_templates, "Template expansion (advisor/commercial)."),
+            (seeker_templates, "Template expansion (seeker/informational)."),
+            (regulator_templates, "Template expansion (regulator/informational)."),
+        ]
     else:
         # In online mode: still add a small, controlled template expansion for diversity.
-        for tpl in advisor_templates[:4]:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template backfill (diversity)."))
-        for tpl in seeker_templates[:4]:
-            candidates.append(Candidate(phrase=fmt(tpl), provenance="llm_inferred", rationale="Template backfill (diversity)."))
+        template_groups = [
+            (advisor_templates[:4], "Template backfill (diversity)."),
+            (seeker_templates[:4], "Template backfill (diversity)."),
+        ]
+    for templates, rationale in template_groups:
+        for tpl in templates:
+            _add(tpl.format_map(ctx), "llm_inferred", rationale)
 
     # Generate some additional variations by adding common modifiers
     modifiers = ["bästa", "billigast", "snabbt", "utan uc", "med låg ränta", "utan säkerhet"]
@@ -232,23 +227,11 @@ def generate_candidates(
 
     for m in modifiers:
         for b in bases:
-            candidates.append(Candidate(phrase=f"{m} {b}", provenance="llm_inferred", rationale="Modifier recombination."))
-
-    # Dedup (case-insensitive)
-    seen = set()
-    deduped: List[Candidate] = []
-    for c in candidates:
-        k = re.sub(r"\s+", " ", c.phrase.strip().lower())
-        if not k or k == seed_phrase.strip().lower():
-            continue
-        if k in seen:
-            continue
-        seen.add(k)
-        deduped.append(Candidate(phrase=k, provenance=c.provenance, rationale=c.rationale, metrics=c.metrics))
+            _add(f"{m} {b}", "llm_inferred", "Modifier recombination.")
 
     # If we still have too few, pad with "hur" questions around topic
-    while len(deduped) < target_pool:
-        idx = len(deduped) + 1
-        deduped.append(Candidate(phrase=f"hur fungerar {topic} {idx}", provenance="llm_inferred", rationale="Padding to reach pool size."))
+    while len(candidates) < target_pool:
+        idx = len(candidates) + 1
+        candidates.append(Candidate(phrase=f"hur fungerar {topic} {idx}", provenance="llm_inferred", rationale="Padding to reach pool size."))
 
-    return deduped[:target_pool]
+    return candidates[:target_pool]
@@ -25,7 +25,7 @@ PALETTE = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Cluster:
     id: str
     label: str
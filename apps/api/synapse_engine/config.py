@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     """Deep merge dict b into a (returns new dict)."""
@@ -40,7 +45,7 @@ class SpecPack:
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 def load_base_pack(spec_root: Path) -> SpecPack:
@@ -22,7 +22,7 @@ REGULATION_WORDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     id: str
     surface: str
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import re
 
+import ahocorasick
 
+from .utils import remember
 
-@dataclass
+
+@dataclass(slots=True)
 class IntentLabel:
     intent: str
     confidence: float
@@ -14,6 +18,24 @@ class IntentLabel:
     secondary: List[str]
 
 
+# Offer heuristic: an amount of three or more digits
+_OFFER_AMOUNT_RE = re.compile(r"\d{3,}")
+
+# Column order of intent_distance_matrix rows
+_ORDER_INDEX = {
+    iid: i
+    for i, iid in enumerate(["informational", "howto", "commercial", "transactional", "navigational", "local", "freshness"])
+}
+
+# Per-model caches hold a reference to the model; keep only the most recent few.
+_MODEL_CACHE_SIZE = 8
+
+# id(intent_model) -> (model, automaton over every modifier signal, intent ids in spec order)
+_SIGNAL_AUTOMATA: Dict[int, Tuple[Dict[str, Any], Optional[Any], List[str]]] = {}
+# id(intent_model) -> (model, {intent id: x_position})
+_X_POSITIONS: Dict[int, Tuple[Dict[str, Any], Dict[str, float]]] = {}
+
+
 def _signals_for_intents(intent_model: Dict[str, Any]) -> Dict[str, List[str]]:
     return {
         iid: (rule.get("signals", []) or [])
@@ -21,6 +43,34 @@ def _signals_for_intents(intent_model: Dict[str, Any]) -> Dict[str, List[str]]:
     }
 
 
+def _signal_automaton(intent_model: Dict[str, Any]) -> Tuple[Optional[Any], List[str]]:
+    """Aho-Corasick automaton over the model's modifier signals, built once per model.
+
+    Each signal maps to (signal, ids of the intents listing it); repeats are kept
+    so hit counts match a per-list substring scan.
+    """
+    cached = _SIGNAL_AUTOMATA.get(id(intent_model))
+    if cached is not None and cached[0] is intent_model:
+        return cached[1], cached[2]
+
+    signals = _signals_for_intents(intent_model)
+    owners: Dict[str, List[str]] = {}
+    for iid, sigs in signals.items():
+        for s in sigs:
+            owners.setdefault(s, []).append(iid)
+
+    automaton = None
+    if owners:
+        automaton = ahocorasick.Automaton()
+        for s, iids in owners.items():
+            automaton.add_word(s, (s, tuple(iids)))
+        automaton.make_automaton()
+
+    order = list(signals)
+    remember(_SIGNAL_AUTOMATA, id(intent_model), (intent_model, automaton, order), _MODEL_CACHE_SIZE)
+    return automaton, order
+
+
 def infer_intent_rule_based(phrase: str, intent_model: Dict[str, Any], serp_present: bool = False) -> IntentLabel:
     """Cheap phase-1 intent inference using modifier signals.
 
@@ -28,12 +78,12 @@ def infer_intent_rule_based(phrase: str, intent_model: Dict[str, Any], serp_pres
 
     If serp_present is False, caps confidence to 0.55 as per pack guidance.
     """
-    signals = _signals_for_intents(intent_model)
+    automaton, order = _signal_automaton(intent_model)
     p = phrase.lower()
 
     # Heuristic: offer-like phrasing with a large amount often behaves as transactional.
     # Example: "privatlån upp till 800 000" (provider offer)
-    if ("upp till" in p or "ränta från" in p or "ansök" in p or "ansok" in p) and re.search(r"\d{3,}", p):
+    if ("upp till" in p or "ränta från" in p or "ansök" in p or "ansok" in p) and _OFFER_AMOUNT_RE.search(p):
         base_intent = "transactional"
         conf = 0.70 if serp_present else 0.55
         ev = ["heuristic_offer"]
@@ -42,11 +92,13 @@ def infer_intent_rule_based(phrase: str, intent_model: Dict[str, Any], serp_pres
             ev.append("no_serp")
         return IntentLabel(intent=base_intent, confidence=min(conf, 0.55) if not serp_present else conf, evidence_used=ev, secondary=secondary)
 
-    matches: List[Tuple[str, int, List[str]]] = []
-    for iid, sigs in signals.items():
-        hit = [s for s in sigs if s in p]
-        if hit:
-            matches.append((iid, len(hit), hit))
+    # Single pass over the phrase; every distinct signal found counts once per listing intent
+    counts: Counter = Counter()
+    if automaton is not None:
+        matched = dict(value for _, value in automaton.iter(p))  # signal -> intent ids
+        for iids in matched.values():
+            counts.update(iids)
+    matches: List[Tuple[str, int]] = [(iid, counts[iid]) for iid in order if counts[iid]]
 
     if not matches:
         # Default guess: informational
@@ -70,11 +122,15 @@ def infer_intent_rule_based(phrase: str, intent_model: Dict[str, Any], serp_pres
 
 
 def intent_x_position(intent: str, intent_model: Dict[str, Any]) -> float:
-    intents = intent_model.get("intent_model", {}).get("intents", []) or []
-    for it in intents:
-        if it.get("id") == intent:
-            return float(it.get("x_position", 0.5))
-    return 0.5
+    cached = _X_POSITIONS.get(id(intent_model))
+    if cached is None or cached[0] is not intent_model:
+        intents = intent_model.get("intent_model", {}).get("intents", []) or []
+        xs: Dict[str, float] = {}
+        for it in intents:
+            xs.setdefault(it.get("id"), float(it.get("x_position", 0.5)))
+        cached = (intent_model, xs)
+        remember(_X_POSITIONS, id(intent_model), cached, _MODEL_CACHE_SIZE)
+    return cached[1].get(intent, 0.5)
 
 
 def intent_distance(a: str, b: str, scoring_model: Dict[str, Any]) -> float:
@@ -82,10 +138,8 @@ def intent_distance(a: str, b: str, scoring_model: Dict[str, Any]) -> float:
     if a not in mat or b not in mat:
         # conservative
         return 0.5
-    order = ["informational","howto","commercial","transactional","navigational","local","freshness"]
-    try:
-        bi = order.index(b)
-    except ValueError:
+    bi = _ORDER_INDEX.get(b)
+    if bi is None:
         return 0.5
     row = mat[a]
     if bi >= len(row):
@@ -4,14 +4,22 @@ All data classes, enums, config loading, and schema validation live here.
 """
 from __future__ import annotations
 
+import copy
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -19,11 +27,18 @@ import yaml
 
 def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     out = dict(a)
-    for k, v in b.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = _deep_merge(out[k], v)
-        else:
-            out[k] = v
+    # Explicit stack instead of recursion; nested dicts on the left are copied, not mutated
+    stack = [(out, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(cur, dict) and isinstance(v, dict):
+                new = dict(cur)
+                dst[k] = new
+                stack.append((new, v))
+            else:
+                dst[k] = v
     return out
 
 
@@ -47,12 +62,26 @@ class SpecPack:
         return self.intent_model.get("intent_model", {}).get("market", "")
 
 
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Parsed YAML, reused until the file changes on disk.
+
+    The returned dict is shared between callers: treat it as read-only.
+    """
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
 
 
 def load_base_pack(spec_root: Path) -> SpecPack:
+    """Base spec pack under spec_root/02_specs.
+
+    Cheap to call per run: each YAML file is parsed once and reused until its
+    mtime changes, so repeated calls only stat the files.
+    """
     specs = spec_root / "02_specs"
     return SpecPack(
         base_dir=spec_root,
@@ -75,7 +104,8 @@ def load_vertical_pack(template_path: Path) -> SpecPack:
 
     merged: Dict[str, Any] = {}
     for inc in includes:
-        merged = _deep_merge(merged, _load_yaml((base / inc).resolve()))
+        # Copied: overrides below mutate the merged models in place
+        merged = _deep_merge(merged, copy.deepcopy(_load_yaml((base / inc).resolve())))
 
     overrides = pack.get("overrides", {})
 
@@ -115,14 +145,14 @@ def load_vertical_pack(template_path: Path) -> SpecPack:
 # ============================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedPhrase:
     raw: str
     canonical: str
     display: str
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentLabel:
     intent: str
     confidence: float
@@ -130,14 +160,14 @@ class IntentLabel:
     secondary: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PerspectiveLabel:
     perspective: str
     confidence: float
     evidence_used: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     id: str
     surface: str
@@ -148,7 +178,7 @@ class Entity:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     phrase: str
     provenance: str
@@ -156,7 +186,7 @@ class Candidate:
     metrics: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredCandidate:
     id: str
     phrase: str
@@ -168,7 +198,7 @@ class ScoredCandidate:
     relevance_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Cluster:
     id: str
     label: str
@@ -179,7 +209,7 @@ class Cluster:
     hub_entities: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SerpSnapshot:
     keyword: str
     top_urls: List[str]
@@ -203,11 +233,35 @@ class SerpSnapshot:
 # ============================================================
 
 
+_VALIDATOR_CACHE: Dict[Path, "SchemaValidator"] = {}
+
+
+def get_validator(schema_dir: Path) -> "SchemaValidator":
+    """Shared SchemaValidator per schema directory (schemas + registry loaded once)."""
+    key = schema_dir.resolve()
+    sv = _VALIDATOR_CACHE.get(key)
+    if sv is None:
+        sv = _VALIDATOR_CACHE[key] = SchemaValidator(key)
+    return sv
+
+
 class SchemaValidator:
+    """Draft 2020-12 validators for every *.schema.json in a directory.
+
+    Each schema is compiled once against a shared registry (cross-file $refs
+    resolve without IO), and no FormatChecker is attached, so `format` stays an
+    annotation. Get instances through get_validator() to share them across runs.
+    """
+
     def __init__(self, schema_dir: Path):
+        # Imported here, not at module level: jsonschema is only needed once validation is used
+        import jsonschema
+
+        self._jsonschema = jsonschema
         self.schema_dir = schema_dir
         self.schemas: Dict[str, Any] = {}
         self._registry = None
+        self._validators: Dict[str, Any] = {}
         self._load_all()
 
     def _load_all(self) -> None:
@@ -227,14 +281,15 @@ class SchemaValidator:
 
         self._registry = Registry().with_resources(resources)
 
-    def validate(self, doc: Dict[str, Any], schema_name: str) -> None:
-        import jsonschema
+        # Compile each schema once; $refs resolve against the finished registry
+        for name, schema in self.schemas.items():
+            self._validators[name] = self._jsonschema.Draft202012Validator(schema, registry=self._registry)
 
+    def validate(self, doc: Dict[str, Any], schema_name: str) -> None:
         if schema_name not in self.schemas:
             raise KeyError(f"Schema not found: {schema_name}")
-        schema = self.schemas[schema_name]
-        validator = jsonschema.Draft202012Validator(schema, registry=self._registry)
-        errors = sorted(validator.iter_errors(doc), key=lambda e: e.path)
+        validator = self._validators[schema_name]
+        errors = sorted(validator.iter_errors(doc), key=lambda e: list(e.path))
         if errors:
             msg = "\n".join([f"{list(e.path)}: {e.message}" for e in errors[:25]])
-            raise jsonschema.ValidationError(f"{schema_name} validation failed:\n{msg}")
+            raise self._jsonschema.ValidationError(f"{schema_name} validation failed:\n{msg}")
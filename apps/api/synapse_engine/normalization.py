@@ -2,16 +2,28 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
+from .utils import remember
 
-@dataclass
+
+@dataclass(slots=True)
 class NormalizedPhrase:
     raw: str
     canonical: str
     display: str
 
 
+# Thousand separators inside numbers: "800 000" -> "800000"
+_SEPARATOR_RE = re.compile(r"(\d)[\s.,](?=\d{3}(\D|$))")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Per-model caches hold a reference to the model; keep only the most recent few.
+_MODEL_CACHE_SIZE = 8
+# Normalized results kept per model (phrase -> (display, canonical))
+_PHRASE_CACHE_SIZE = 65536
+
+
 def normalize_numbers(text: str, strip_separators: bool) -> Tuple[str, str]:
     """Return (display_text, canonical_text) preserving a display version with separators."""
     display = text
@@ -19,29 +31,78 @@ def normalize_numbers(text: str, strip_separators: bool) -> Tuple[str, str]:
 
     # Normalize spaces in numbers like "800 000" -> "800000" in canonical
     if strip_separators:
-        canonical = re.sub(r"(\d)[\s.,](?=\d{3}(\D|$))", r"\1", canonical)
+        canonical = _SEPARATOR_RE.sub(r"\1", canonical)
 
     return display, canonical
 
 
+@dataclass(slots=True)
+class _CompiledRules:
+    lowercase: bool
+    collapse_whitespace: bool
+    # (whole-word pattern, replacement) in spec order
+    variants: List[Tuple[re.Pattern, str]]
+    strip_separators: bool
+    results: Dict[str, Tuple[str, str]]
+
+
+# id(normalization_model) -> (model, compiled rules)
+_COMPILED: Dict[int, Tuple[Dict[str, Any], _CompiledRules]] = {}
+
+
+def _compiled_rules(normalization_model: Dict[str, Any]) -> _CompiledRules:
+    """Rule flags and variant-map regexes for a model, compiled once per model."""
+    cached = _COMPILED.get(id(normalization_model))
+    if cached is not None and cached[0] is normalization_model:
+        return cached[1]
+
+    nm = normalization_model.get("normalization_model", {})
+    rules = nm.get("rules", {})
+    variants = [
+        (re.compile(rf"\b{re.escape(m)}\b"), vm.get("replace_with", ""))
+        for vm in nm.get("variant_maps", []) or []
+        for m in vm.get("match", [])
+    ]
+    compiled = _CompiledRules(
+        lowercase=bool(rules.get("lowercase", False)),
+        collapse_whitespace=bool(rules.get("collapse_whitespace", False)),
+        variants=variants,
+        strip_separators=bool(rules.get("normalize_numbers", {}).get("strip_separators", False)),
+        results={},
+    )
+    remember(_COMPILED, id(normalization_model), (normalization_model, compiled), _MODEL_CACHE_SIZE)
+    return compiled
+
+
 def normalize_phrase(phrase: str, normalization_model: Dict[str, Any]) -> NormalizedPhrase:
-    rules = normalization_model.get("normalization_model", {}).get("rules", {})
+    return _normalize(phrase, _compiled_rules(normalization_model))
+
+
+def normalize_phrases(phrases: List[str], normalization_model: Dict[str, Any]) -> List[NormalizedPhrase]:
+    """Batch form of normalize_phrase: the model's rules are looked up once for the whole list."""
+    rules = _compiled_rules(normalization_model)
+    return [_normalize(p, rules) for p in phrases]
+
+
+def _normalize(phrase: str, rules: _CompiledRules) -> NormalizedPhrase:
+    hit = rules.results.get(phrase)
+    if hit is not None:
+        return NormalizedPhrase(raw=phrase, canonical=hit[1], display=hit[0])
+
     t = phrase
 
-    if rules.get("lowercase", False):
+    if rules.lowercase:
         t = t.lower()
 
-    if rules.get("collapse_whitespace", False):
-        t = re.sub(r"\s+", " ", t).strip()
+    if rules.collapse_whitespace:
+        t = _WHITESPACE_RE.sub(" ", t).strip()
 
-    # Variant maps
-    for vm in normalization_model.get("normalization_model", {}).get("variant_maps", []) or []:
-        matches = vm.get("match", [])
-        repl = vm.get("replace_with", "")
-        for m in matches:
-            # whole-word replacement
-            t = re.sub(rf"\b{re.escape(m)}\b", repl, t)
+    # Variant maps (whole-word replacement)
+    for pattern, repl in rules.variants:
+        t = pattern.sub(repl, t)
 
-    disp, canon = normalize_numbers(t, bool(rules.get("normalize_numbers", {}).get("strip_separators", False)))
+    disp, canon = normalize_numbers(t, rules.strip_separators)
 
+    if len(rules.results) < _PHRASE_CACHE_SIZE:
+        rules.results[phrase] = (disp, canon)
     return NormalizedPhrase(raw=phrase, canonical=canon, display=disp)
@@ -1,35 +1,79 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import ahocorasick
 
-@dataclass
+from .utils import remember
+
+
+@dataclass(slots=True)
 class PerspectiveLabel:
     perspective: str
     confidence: float
     evidence_used: List[str]
 
 
-def infer_perspective_rule_based(phrase: str, perspective_model: Dict[str, Any], serp_present: bool = False) -> PerspectiveLabel:
+# Column order of distance_matrix rows
+_ORDER_INDEX = {"provider": 0, "seeker": 1, "advisor": 2, "regulator": 3, "neutral": 4}
+
+# Per-model caches hold a reference to the model; keep only the most recent few.
+_MODEL_CACHE_SIZE = 8
+
+
+# id(perspective_model) -> (model, automaton over every signal phrase, perspective ids in spec order)
+_SIGNAL_AUTOMATA: Dict[int, Tuple[Dict[str, Any], Optional[Any], List[str]]] = {}
+
+
+def _signal_automaton(perspective_model: Dict[str, Any]) -> Tuple[Optional[Any], List[str]]:
+    """Aho-Corasick automaton over the model's signal phrases, built once per model.
+
+    Each phrase maps to (phrase, ids of the perspectives listing it); repeats are
+    kept so hit counts match a per-list substring scan.
+    """
+    cached = _SIGNAL_AUTOMATA.get(id(perspective_model))
+    if cached is not None and cached[0] is perspective_model:
+        return cached[1], cached[2]
+
     signals = perspective_model.get("perspective_model", {}).get("signals", {}) or {}
+    owners: Dict[str, List[str]] = {}
+    for pid, sig in signals.items():
+        for s in sig.get("phrases", []) or []:
+            owners.setdefault(s, []).append(pid)
+
+    automaton = None
+    if owners:
+        automaton = ahocorasick.Automaton()
+        for s, pids in owners.items():
+            automaton.add_word(s, (s, tuple(pids)))
+        automaton.make_automaton()
+
+    order = list(signals)
+    remember(_SIGNAL_AUTOMATA, id(perspective_model), (perspective_model, automaton, order), _MODEL_CACHE_SIZE)
+    return automaton, order
+
+
+def infer_perspective_rule_based(phrase: str, perspective_model: Dict[str, Any], serp_present: bool = False) -> PerspectiveLabel:
+    automaton, order = _signal_automaton(perspective_model)
     p = phrase.lower()
 
-    matches: List[Tuple[str, int, List[str]]] = []
-    for pid, sig in signals.items():
-        phrases = sig.get("phrases", []) or []
-        hit = [s for s in phrases if s in p]
-        if hit:
-            matches.append((pid, len(hit), hit))
+    # Single pass over the phrase; every distinct signal phrase found counts once
+    counts: Counter = Counter()
+    if automaton is not None:
+        matched = dict(value for _, value in automaton.iter(p))  # phrase -> perspective ids
+        for pids in matched.values():
+            counts.update(pids)
 
-    if not matches:
+    if not counts:
         base = "neutral"
         conf = 0.45
         ev = ["no_signal_match"]
     else:
-        matches.sort(key=lambda x: x[1], reverse=True)
-        base = matches[0][0]
-        conf = min(0.35 + 0.12 * matches[0][1], 0.75)
+        # First perspective (in spec order) with the most hits
+        base = max(order, key=lambda pid: counts[pid])
+        conf = min(0.35 + 0.12 * counts[base], 0.75)
         ev = ["signal_match"]
 
     if not serp_present:
@@ -39,22 +83,28 @@ def infer_perspective_rule_based(phrase: str, perspective_model: Dict[str, Any],
     return PerspectiveLabel(perspective=base, confidence=conf, evidence_used=ev)
 
 
+# id(perspective_model) -> (model, {perspective id: y_position})
+_Y_POSITIONS: Dict[int, Tuple[Dict[str, Any], Dict[str, float]]] = {}
+
+
 def perspective_y_position(perspective: str, perspective_model: Dict[str, Any]) -> float:
-    arr = perspective_model.get("perspective_model", {}).get("perspectives", []) or []
-    for p in arr:
-        if p.get("id") == perspective:
-            return float(p.get("y_position", 0.5))
-    return 0.5
+    cached = _Y_POSITIONS.get(id(perspective_model))
+    if cached is None or cached[0] is not perspective_model:
+        arr = perspective_model.get("perspective_model", {}).get("perspectives", []) or []
+        ys: Dict[str, float] = {}
+        for p in arr:
+            ys.setdefault(p.get("id"), float(p.get("y_position", 0.5)))
+        cached = (perspective_model, ys)
+        remember(_Y_POSITIONS, id(perspective_model), cached, _MODEL_CACHE_SIZE)
+    return cached[1].get(perspective, 0.5)
 
 
 def perspective_distance(a: str, b: str, perspective_model: Dict[str, Any]) -> float:
     mat = perspective_model.get("perspective_model", {}).get("distance_matrix", {}) or {}
     if a not in mat or b not in mat:
         return 0.5
-    order = ["provider","seeker","advisor","regulator","neutral"]
-    try:
-        bi = order.index(b)
-    except ValueError:
+    bi = _ORDER_INDEX.get(b)
+    if bi is None:
         return 0.5
     row = mat[a]
     if bi >= len(row):
@@ -5,20 +5,22 @@ All logic lives in the individual module files.
 """
 from __future__ import annotations
 
-import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .models import SchemaValidator, load_base_pack
-from .normalization import normalize_phrase
-from .utils import stable_qid
+import numpy as np
+
+from .models import get_validator, load_base_pack
+from .normalization import normalize_phrase, normalize_phrases
+from .utils import fetch_concurrently, stable_qid
 from .intent import infer_intent_rule_based, intent_x_position
 from .perspective import infer_perspective_rule_based
 from .candidates import generate_candidates
-from .scoring import build_tfidf_embeddings, score_candidates, mmr_select
-from .clustering import cluster_nodes
 from .synapses import build_edges_seed_to_nodes, build_intra_cluster_edges
-from .visual import assign_positions, compute_cluster_centroids, legend, now_iso
+from .visual import assign_positions, compute_cluster_centroids, legend, node_sizes, now_iso
 
 
 def run_pipeline(
@@ -38,29 +40,56 @@ def run_pipeline(
     # M0: normalize seed
     nseed = normalize_phrase(seed_phrase, pack.normalization_model)
 
-    # Optional: seed SERP snapshot (ToS-safe via DataForSEO)
+    # Optional: seed SERP snapshot (ToS-safe via DataForSEO). It is only needed once the
+    # candidate providers have answered, so it runs in the background alongside them.
     serp_calls_used = 0
     seed_serp_snapshot: Optional[Dict[str, Any]] = None
     seed_serp_top_urls: List[str] = []
+    seed_serp_future: Optional[Future] = None
 
     if runtime is not None and runtime.providers.dataforseo is not None and runtime.budget.serp_calls_max > 0:
-        try:
-            from .serp import fetch_seed_serp
-
-            seed_serp = fetch_seed_serp(
-                runtime.providers.dataforseo,
-                keyword=nseed.canonical,
-                location_name=runtime.location_name,
-                location_code=runtime.location_code,
-                language_code=runtime.language_code,
-                depth=runtime.budget.serp_depth,
-            )
-            serp_calls_used += 1
-            seed_serp_snapshot = seed_serp.to_dict()
-            seed_serp_top_urls = seed_serp.top_urls
-        except Exception:
-            seed_serp_snapshot = None
-            seed_serp_top_urls = []
+        from .serp import fetch_seed_serp
+
+        seed_pool = ThreadPoolExecutor(max_workers=1)
+        seed_serp_future = seed_pool.submit(
+            fetch_seed_serp,
+            runtime.providers.dataforseo,
+            keyword=nseed.canonical,
+            location_name=runtime.location_name,
+            location_code=runtime.location_code,
+            language_code=runtime.language_code,
+            depth=runtime.budget.serp_depth,
+        )
+        # Don't block here; the submitted fetch still runs to completion
+        seed_pool.shutdown(wait=False)
+
+    def resolve_seed_serp() -> Optional[Dict[str, Any]]:
+        nonlocal serp_calls_used, seed_serp_snapshot, seed_serp_top_urls, seed_serp_future
+        if seed_serp_future is not None:
+            try:
+                seed_serp = seed_serp_future.result()
+                serp_calls_used += 1
+                seed_serp_snapshot = seed_serp.to_dict()
+                seed_serp_top_urls = seed_serp.top_urls
+            except Exception:
+                seed_serp_snapshot = None
+                seed_serp_top_urls = []
+            seed_serp_future = None
+        return seed_serp_snapshot
+
+    # M3: candidate pool
+    pool_target = 300
+    if runtime is not None:
+        pool_target = int(runtime.budget.candidate_pool_target)
+    candidate_pool = generate_candidates(
+        nseed.canonical,
+        language,
+        market,
+        target_pool=pool_target,
+        runtime=runtime,
+        seed_serp_snapshot=resolve_seed_serp,
+    )
+    resolve_seed_serp()
 
     seed_serp_present = bool(seed_serp_top_urls)
 
@@ -76,30 +105,28 @@ def run_pipeline(
         "perspective": seed_per.perspective,
     }
 
-    # M3: candidate pool
-    pool_target = 300
-    if runtime is not None:
-        pool_target = int(runtime.budget.candidate_pool_target)
-    candidate_pool = generate_candidates(
-        nseed.canonical,
-        language,
-        market,
-        target_pool=pool_target,
-        runtime=runtime,
-        seed_serp_snapshot=seed_serp_snapshot,
-    )
-
     def cap_for_provenance(prov: str) -> float:
         return 0.55 if prov == "llm_inferred" else 0.90
 
+    # Normalize the whole pool in one pass, then run the rule passes per row
+    normalized = normalize_phrases([c.phrase for c in candidate_pool], pack.normalization_model)
+
+    # Phrases that normalize to the same canonical form share one rule pass per evidence level
+    rule_pass: Dict[Tuple[str, bool], Tuple[Any, Any, str]] = {}
+
     candidates: List[Dict[str, Any]] = []
-    for c in candidate_pool:
-        nc = normalize_phrase(c.phrase, pack.normalization_model)
+    for c, nc in zip(candidate_pool, normalized):
         prov = c.provenance
         ext_ev = prov != "llm_inferred"
-        iid = infer_intent_rule_based(nc.canonical, pack.intent_model, serp_present=ext_ev)
-        pid = infer_perspective_rule_based(nc.canonical, pack.perspective_model, serp_present=ext_ev)
-        cid = stable_qid(nc.canonical, language, market)
+        key = (nc.canonical, ext_ev)
+        hit = rule_pass.get(key)
+        if hit is None:
+            hit = rule_pass[key] = (
+                infer_intent_rule_based(nc.canonical, pack.intent_model, serp_present=ext_ev),
+                infer_perspective_rule_based(nc.canonical, pack.perspective_model, serp_present=ext_ev),
+                stable_qid(nc.canonical, language, market),
+            )
+        iid, pid, cid = hit
         conf = min(iid.confidence, pid.confidence, cap_for_provenance(prov))
         candidates.append({
             "id": cid,
@@ -114,6 +141,15 @@ def run_pipeline(
             "serp_shared_urls": [],
         })
 
+    # Scoring and clustering pull in scikit-learn/scipy; import on first use so that
+    # importing the package (e.g. API cold start) does not pay for them.
+    from .scoring import score_candidates, mmr_select, rescore_serp_overlap
+    from .clustering import cluster_nodes
+
+    # M7 scores; set early by SERP refinement, which only changes serp_overlap afterwards
+    scored = None
+    X_all = None
+
     # Optional: SERP refinement
     if (
         runtime is not None
@@ -125,7 +161,7 @@ def run_pipeline(
         try:
             from .serp import fetch_seed_serp, serp_overlap as _serp_overlap
 
-            scored0, _, _ = score_candidates(
+            scored, X_all, _sims = score_candidates(
                 seed_phrase=nseed.canonical,
                 seed_intent=seed["intent"],
                 seed_perspective=seed["perspective"],
@@ -138,19 +174,17 @@ def run_pipeline(
 
             remaining = int(runtime.budget.serp_calls_max) - int(serp_calls_used)
             refine_n = max(0, min(int(runtime.budget.serp_refine_top_n), remaining))
-            refine_ids = [sc.id for sc in sorted(scored0, key=lambda s: s.relevance_score, reverse=True)[:refine_n]]
+            refine_ids = [sc.id for sc in sorted(scored, key=lambda s: s.relevance_score, reverse=True)[:refine_n]]
 
             id_to_phrase = {c["id"]: c["phrase"] for c in candidates}
             id_to_idx = {c["id"]: i for i, c in enumerate(candidates)}
 
-            for cid in refine_ids:
-                if serp_calls_used >= runtime.budget.serp_calls_max:
-                    break
-                phrase = id_to_phrase.get(cid)
-                if not phrase:
-                    continue
-                try:
-                    cand_serp = fetch_seed_serp(
+            # refine_n already fits the remaining SERP budget, so every call can go out at once
+            refine = [(cid, id_to_phrase[cid]) for cid in refine_ids if id_to_phrase.get(cid)]
+            cand_serps = fetch_concurrently(
+                [
+                    partial(
+                        fetch_seed_serp,
                         runtime.providers.dataforseo,
                         keyword=phrase,
                         location_name=runtime.location_name,
@@ -158,32 +192,46 @@ def run_pipeline(
                         language_code=runtime.language_code,
                         depth=runtime.budget.serp_depth,
                     )
-                    serp_calls_used += 1
+                    for _, phrase in refine
+                ],
+                max_workers=int(runtime.budget.serp_concurrency),
+            )
+
+            seed_top_set = frozenset(seed_serp_top_urls)
+            refined: Dict[int, float] = {}
+            for (cid, _), cand_serp in zip(refine, cand_serps):
+                if cand_serp is None:
+                    continue
+                serp_calls_used += 1
 
-                    ov = _serp_overlap(seed_serp_top_urls, cand_serp.top_urls)
-                    shared = [u for u in seed_serp_top_urls if u in set(cand_serp.top_urls)][:6]
+                cand_set = frozenset(cand_serp.top_urls)
+                ov = _serp_overlap(seed_top_set, cand_set)
+                shared = [u for u in seed_serp_top_urls if u in cand_set][:6]
 
-                    idx = id_to_idx.get(cid)
-                    if idx is None:
-                        continue
-                    candidates[idx]["serp_overlap"] = float(ov)
-                    candidates[idx]["serp_shared_urls"] = shared
-                except Exception:
+                idx = id_to_idx.get(cid)
+                if idx is None:
                     continue
+                candidates[idx]["serp_overlap"] = float(ov)
+                candidates[idx]["serp_shared_urls"] = shared
+                refined[idx] = float(ov)
+
+            # Only the refined rows change; TF-IDF and the other features are reused
+            rescore_serp_overlap(scored, refined, pack.scoring_model)
         except ImportError:
             pass
 
     # M7: scoring
-    scored, X_all, _sims = score_candidates(
-        seed_phrase=nseed.canonical,
-        seed_intent=seed["intent"],
-        seed_perspective=seed["perspective"],
-        candidates=candidates,
-        language=language,
-        market=market,
-        scoring_model=pack.scoring_model,
-        perspective_model=pack.perspective_model,
-    )
+    if scored is None:
+        scored, X_all, _sims = score_candidates(
+            seed_phrase=nseed.canonical,
+            seed_intent=seed["intent"],
+            seed_perspective=seed["perspective"],
+            candidates=candidates,
+            language=language,
+            market=market,
+            scoring_model=pack.scoring_model,
+            perspective_model=pack.perspective_model,
+        )
 
     sel_spec = pack.scoring_model.get("scoring_model", {}).get("mmr_selection", {})
     k = int(target or sel_spec.get("target", 50))
@@ -195,20 +243,29 @@ def run_pipeline(
     # Map metrics + serp evidence onto selected nodes
     cand_by_id = {c["id"]: c for c in candidates}
 
-    # Build node dicts
-    nodes: List[Dict[str, Any]] = []
+    # Node metadata and search volumes
+    metas: List[Dict[str, Any]] = []
+    vols: List[Optional[float]] = []
     for sc in selected_scored:
         meta = cand_by_id.get(sc.id, {})
-        m = meta.get("metrics") or {}
-        vol = m.get("search_volume")
+        vol = (meta.get("metrics") or {}).get("search_volume")
         try:
             vol_f = float(vol) if vol is not None else None
         except Exception:
             vol_f = None
+        metas.append(meta)
+        vols.append(vol_f)
+
+    # Node sizes for the whole selection at once: relevance plus a capped log-volume bonus
+    sizes = node_sizes(
+        np.fromiter((sc.relevance_score for sc in selected_scored), dtype=float, count=len(selected_scored)),
+        np.fromiter((v if v is not None else 0.0 for v in vols), dtype=float, count=len(vols)),
+    )
 
-        size = float(6 + 18 * sc.relevance_score)
-        if vol_f is not None and vol_f > 0:
-            size = float(size + 4.0 * min(1.0, math.log10(1.0 + vol_f) / 5.0))
+    # Build node dicts
+    nodes: List[Dict[str, Any]] = []
+    for sc, meta, vol_f, size in zip(selected_scored, metas, vols, sizes.tolist()):
+        m = meta.get("metrics") or {}
         nodes.append({
             "id": sc.id,
             "phrase": sc.phrase,
@@ -231,7 +288,9 @@ def run_pipeline(
     node_intents = [n["intent"] for n in nodes]
     node_persps = [n["perspective"] for n in nodes]
 
-    X_nodes = build_tfidf_embeddings(node_phrases)
+    # Rows of the M7 TF-IDF matrix (row 0 is the seed); equal ids share a canonical phrase
+    row_of = {c["id"]: i for i, c in enumerate(candidates, start=1)}
+    X_nodes = X_all[[row_of[nid] for nid in node_ids]]
 
     cluster_ids, clusters_obj = cluster_nodes(
         node_ids=node_ids,
@@ -269,8 +328,8 @@ def run_pipeline(
     clusters_xy = compute_cluster_centroids(clusters, nodes_xy)
 
     # M6: synapses
-    edges = build_edges_seed_to_nodes(seed_xy, nodes_xy, evidence_cap=0.90)
-    edges += build_intra_cluster_edges(nodes_xy, min_strength=float(pack.scoring_model.get("scoring_model", {}).get("thresholds", {}).get("edge_display_min_strength", 0.40)))
+    seed_edges = build_edges_seed_to_nodes(seed_xy, nodes_xy, evidence_cap=0.90)
+    edges = seed_edges + build_intra_cluster_edges(nodes_xy, min_strength=float(pack.scoring_model.get("scoring_model", {}).get("thresholds", {}).get("edge_display_min_strength", 0.40)))
 
     # GraphArtifact
     graph = {
@@ -328,9 +387,11 @@ def run_pipeline(
         "selected": [],
     }
 
-    syn_by_to = {e["to"]: e["synapse_card"] for e in edges if e["from"] == seed_xy["id"]}
+    # Seed edges are kept separately, so no scan over the intra-cluster edges is needed
+    syn_by_to = {e["to"]: e["synapse_card"] for e in seed_edges}
 
-    for rank, n in enumerate(sorted(nodes_xy, key=lambda x: x.get("relevance_score", 0.0), reverse=True), start=1):
+    # Every node dict carries relevance_score (set when the nodes are built above)
+    for rank, n in enumerate(sorted(nodes_xy, key=itemgetter("relevance_score"), reverse=True), start=1):
         related["selected"].append({
             "id": n["id"],
             "phrase": n["phrase"],
@@ -350,7 +411,7 @@ def run_pipeline(
         })
 
     # Validate against schemas
-    sv = SchemaValidator(spec_root / "03_schemas")
+    sv = get_validator(spec_root / "03_schemas")
     sv.validate(graph, "GraphArtifact.schema.json")
     sv.validate(related, "RelatedQueriesOutput.schema.json")
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
-
-from requests.auth import HTTPBasicAuth
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..utils import engine_home
 from .http import HttpClient, ProviderError
 
 
+def _loc_lang_cache_dir() -> Path:
+    return engine_home() / "cache"
+
+
 @dataclass
 class DataForSEOCredentials:
     login: str
@@ -32,12 +37,16 @@ class DataForSEOClient:
         self.api_version = api_version.strip("/")
         self.http = http or HttpClient()
 
+    def _auth(self) -> Tuple[str, str]:
+        # requests treats a (user, password) tuple as HTTP Basic auth
+        return (self.creds.login, self.creds.password)
+
     def _post(self, path: str, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
         url = f"{self.base_url}/{self.api_version}/{path.lstrip('/')}"
         return self.http.request(
             "POST",
             url,
-            auth=HTTPBasicAuth(self.creds.login, self.creds.password),
+            auth=self._auth(),
             json_body=tasks,
         )
 
@@ -46,13 +55,16 @@ class DataForSEOClient:
         return self.http.request(
             "GET",
             url,
-            auth=HTTPBasicAuth(self.creds.login, self.creds.password),
+            auth=self._auth(),
             params=params,
         )
 
     # -------------------------
     # Candidate generation
     # -------------------------
+    # Like the SERP call below, these are live endpoints: one task per POST. The
+    # keyword_suggestions/related_keywords requests are issued concurrently by
+    # generate_candidates rather than batched.
     def keyword_suggestions(
         self,
         seed: str,
@@ -106,6 +118,8 @@ class DataForSEOClient:
     # -------------------------
     # SERP snapshot
     # -------------------------
+    # Live endpoints take a single task per POST, so SERP calls cannot be batched
+    # into one request; run_pipeline fans them out concurrently instead.
     def serp_live_advanced(
         self,
         keyword: str,
@@ -134,9 +148,39 @@ class DataForSEOClient:
     # -------------------------
     # Utility
     # -------------------------
-    def locations_and_languages(self) -> Dict[str, Any]:
-        # Unified endpoint for labs.
-        return self._get("dataforseo_labs/locations_and_languages")
+    def locations_and_languages(self, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """Unified locations/languages list for labs.
+
+        The payload is large and rarely changes, so it is kept on disk with its ETag;
+        a 304 revalidation reuses the cached body instead of downloading it again.
+        """
+        cache_dir = cache_dir or _loc_lang_cache_dir()
+        body_path = cache_dir / "loc_lang.json"
+        etag_path = cache_dir / "loc_lang.etag"
+
+        headers: Dict[str, str] = {}
+        if body_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+        url = f"{self.base_url}/{self.api_version}/dataforseo_labs/locations_and_languages"
+        r = self.http.send(
+            "GET",
+            url,
+            headers=headers or None,
+            auth=self._auth(),
+        )
+        if r.status_code == 304:
+            return self.http.decode(body_path.read_bytes())
+
+        etag = r.headers.get("ETag")
+        if etag and r.content:
+            # Body first, then the ETag, each swapped in whole: a new ETag never pairs with a stale body
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for path, data in ((body_path, r.content), (etag_path, etag.encode("utf-8"))):
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+        return self.http.decode(r.content)
 
 
 def _dfs_extract_result_items(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -174,6 +218,16 @@ def parse_keyword_suggestions(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     return out
 
 
+# SERP item types whose own `url` is a top result
+_RESULT_TYPES = frozenset({"organic", "paid", "featured_snippet", "top_stories", "local_pack"})
+# Item types with nested questions/queries -> (snapshot key, fields tried in order)
+_NESTED_QUERY_FIELDS: Dict[str, Tuple[str, Tuple[str, str]]] = {
+    "people_also_ask": ("paa", ("question", "title")),
+    "related_searches": ("related", ("query", "title")),
+    "related_search": ("related", ("query", "title")),
+}
+
+
 def parse_serp_snapshot(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Extract a compact SERP snapshot from DataForSEO Live SERP Advanced."""
     tasks = payload.get("tasks") or []
@@ -188,42 +242,52 @@ def parse_serp_snapshot(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     top_urls: List[str] = []
     features: List[str] = []
-    paa: List[str] = []
-    related: List[str] = []
-
-    def add_feature(t: str) -> None:
-        if t and t not in features:
-            features.append(t)
+    # snapshot key -> (ordered values, membership set)
+    nested: Dict[str, Tuple[List[str], Set[str]]] = {"paa": ([], set()), "related": ([], set())}
+    # Membership sets alongside the ordered lists
+    top_urls_seen: Set[str] = set()
+    features_seen: Set[str] = set()
+    # Nested-item URLs, gathered in the same pass; only used if no top-level result URL shows up
+    fallback_urls: List[str] = []
+    fallback_seen: Set[str] = set()
 
     for it in items:
         t = it.get("type")
-        if t:
-            add_feature(str(t))
-        # organic results
-        if t in {"organic", "paid", "featured_snippet", "top_stories", "local_pack"}:
+        if t and t not in features_seen:
+            features_seen.add(t)
+            features.append(str(t))
+        # organic results (only the first 20 are kept)
+        if t in _RESULT_TYPES and len(top_urls) < 20:
             url = it.get("url")
-            if url and url not in top_urls:
+            if url and url not in top_urls_seen:
+                top_urls_seen.add(url)
                 top_urls.append(url)
-        # People also ask
-        if t == "people_also_ask":
-            for qi in it.get("items") or []:
-                q = qi.get("question") or qi.get("title")
-                if q and q not in paa:
-                    paa.append(str(q))
-        # Related searches
-        if t in {"related_searches", "related_search"}:
-            for ri in it.get("items") or []:
-                q = ri.get("query") or ri.get("title")
-                if q and q not in related:
-                    related.append(str(q))
-
-    # Fallback: some organic results may be under `items[i].items` (depending on type)
-    if not top_urls:
-        for it in items:
-            for sub in it.get("items") or []:
+
+        subs = it.get("items") or []
+        # People also ask / related searches
+        spec = _NESTED_QUERY_FIELDS.get(t)
+        if spec is not None:
+            key, fields = spec
+            values, seen = nested[key]
+            for sub in subs:
+                q = sub.get(fields[0]) or sub.get(fields[1])
+                if q and q not in seen:
+                    seen.add(q)
+                    values.append(str(q))
+        # Fallback: some organic results may be under `items[i].items` (depending on type)
+        if not top_urls and len(fallback_urls) < 20:
+            for sub in subs:
                 url = sub.get("url")
-                if url and url not in top_urls:
-                    top_urls.append(url)
+                if url and url not in fallback_seen:
+                    fallback_seen.add(url)
+                    fallback_urls.append(url)
+                    if len(fallback_urls) == 20:
+                        break
+
+    if not top_urls:
+        top_urls = fallback_urls
+    paa = nested["paa"][0]
+    related = nested["related"][0]
 
     return {
         "top_urls": top_urls[:20],
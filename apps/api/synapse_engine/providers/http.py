@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import email.utils
 import json
+import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urlsplit
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # optional speedup for large SERP payloads
+    orjson = None
+
+
+# Keep-alive connections kept per host; also the cap on in-flight requests per host
+_POOL_SIZE = 32
 
 
 class ProviderError(RuntimeError):
@@ -24,6 +38,20 @@ def _is_retryable(status_code: int) -> bool:
     return status_code in {408, 409, 425, 429, 500, 502, 503, 504}
 
 
+def _retry_after_seconds(value: Optional[str]) -> float:
+    """Seconds requested by a Retry-After header (delta-seconds or an HTTP date); 0 if absent/invalid."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
 class HttpClient:
     """Small wrapper around requests with retries.
 
@@ -32,6 +60,35 @@ class HttpClient:
 
     def __init__(self, retry: Optional[RetryPolicy] = None):
         self.retry = retry or RetryPolicy()
+        # Built on first use, so importing/configuring providers does not pay for `requests`
+        self._session: Optional[requests.Session] = None
+        # host -> slots for in-flight requests, so bursts queue here instead of tripping rate limits
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                # One keep-alive pool per client: consecutive calls to the same provider
+                # reuse the TLS connection instead of handshaking per request.
+                session = requests.Session()
+                # Room for the concurrent SERP fan-out; retries are handled in send() below.
+                adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(_POOL_SIZE)
+        return slot
 
     def request(
         self,
@@ -42,49 +99,85 @@ class HttpClient:
         json_body: Any = None,
         auth: Any = None,
     ) -> Dict[str, Any]:
+        r = self.send(method, url, headers=headers, params=params, json_body=json_body, auth=auth)
+        return self.decode(r.content)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Any = None,
+        auth: Any = None,
+    ) -> requests.Response:
+        """Like request(), but return the raw response (any status < 400, e.g. 304)."""
+        data = None
+        if json_body is not None and orjson is not None:
+            # Encode the body once, up front; retries resend the same bytes
+            data = orjson.dumps(json_body)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+            json_body = None
+
         last_err: Optional[Exception] = None
         delay = self.retry.backoff_seconds
+        # Overall budget for all attempts, including the waits between them
+        deadline = time.monotonic() + self.retry.timeout_seconds * (self.retry.retries + 1)
+        slot = self._host_slot(url)
+        session = self._get_session()
 
         for attempt in range(self.retry.retries + 1):
+            min_wait = 0.0
             try:
-                r = requests.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json_body,
-                    auth=auth,
-                    timeout=self.retry.timeout_seconds,
-                )
-
-                if r.status_code >= 400:
-                    # Try to parse JSON error payload if any.
-                    msg = None
-                    try:
-                        msg = r.json()
-                    except Exception:
-                        msg = r.text[:500]
-
-                    if attempt < self.retry.retries and _is_retryable(r.status_code):
-                        time.sleep(delay)
-                        delay *= self.retry.backoff_multiplier
-                        continue
-                    raise ProviderError(f"HTTP {r.status_code} from {url}: {msg}")
-
-                # Success
-                if not r.text:
-                    return {}
-                try:
-                    return r.json()
-                except json.JSONDecodeError:
-                    return {"raw": r.text}
-
+                with slot:
+                    r = session.request(
+                        method=method.upper(),
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        json=json_body,
+                        data=data,
+                        auth=auth,
+                        timeout=self.retry.timeout_seconds,
+                    )
             except Exception as e:
                 last_err = e
-                if attempt < self.retry.retries:
-                    time.sleep(delay)
-                    delay *= self.retry.backoff_multiplier
-                    continue
+            else:
+                if r.status_code < 400:
+                    return r
+
+                # Try to parse JSON error payload if any.
+                msg = None
+                try:
+                    msg = r.json()
+                except Exception:
+                    msg = r.text[:500]
+                last_err = ProviderError(f"HTTP {r.status_code} from {url}: {msg}")
+                if not _is_retryable(r.status_code):
+                    # Retrying a 4xx like 401/404 only burns provider units
+                    raise last_err
+                min_wait = _retry_after_seconds(r.headers.get("Retry-After"))
+
+            if attempt >= self.retry.retries:
                 break
+            # Jittered exponential backoff (never shorter than Retry-After), so concurrent
+            # callers do not retry in lockstep
+            wait = max(min_wait, delay * random.uniform(0.5, 1.5))
+            if time.monotonic() + wait > deadline:
+                break
+            time.sleep(wait)
+            delay *= self.retry.backoff_multiplier
 
         raise ProviderError(f"Request failed: {method} {url}: {last_err}")
+
+    @staticmethod
+    def decode(content: bytes) -> Dict[str, Any]:
+        """Parse a JSON response body (the raw bytes; decoding SERP payloads to str first is wasted work)."""
+        if not content:
+            return {}
+        try:
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return {"raw": content.decode("utf-8", errors="replace")}
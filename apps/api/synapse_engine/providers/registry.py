@@ -7,6 +7,7 @@ from ..secrets import Secrets
 from .ahrefs import AhrefsClient
 from .dataforseo import DataForSEOClient, DataForSEOCredentials
 from .firecrawl import FirecrawlClient
+from .http import HttpClient
 
 
 @dataclass
@@ -20,16 +21,19 @@ class ProviderRegistry:
     @staticmethod
     def from_secrets(secrets: Secrets) -> "ProviderRegistry":
         reg = ProviderRegistry()
+        # One client (and keep-alive pool) shared by every provider
+        http = HttpClient()
 
         if secrets.firecrawl_api_key:
-            reg.firecrawl = FirecrawlClient(api_key=secrets.firecrawl_api_key)
+            reg.firecrawl = FirecrawlClient(api_key=secrets.firecrawl_api_key, http=http)
 
         if secrets.dataforseo_login and secrets.dataforseo_password:
             reg.dataforseo = DataForSEOClient(
-                creds=DataForSEOCredentials(secrets.dataforseo_login, secrets.dataforseo_password)
+                creds=DataForSEOCredentials(secrets.dataforseo_login, secrets.dataforseo_password),
+                http=http,
             )
 
         if secrets.ahrefs_api_key:
-            reg.ahrefs = AhrefsClient(api_key=secrets.ahrefs_api_key)
+            reg.ahrefs = AhrefsClient(api_key=secrets.ahrefs_api_key, http=http)
 
         return reg
@@ -23,6 +23,8 @@ class Budget:
     serp_refine_top_n: int = 30
     # Hard cap for SERP calls in a single run
     serp_calls_max: int = 40
+    # How many candidate SERP calls may be in flight at once
+    serp_concurrency: int = 8
 
 
 @dataclass
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Tuple, Callable
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 
 from .entities import extract_entities_simple, entity_ids
 from .intent import intent_compatibility
@@ -13,7 +14,7 @@ from .perspective import perspective_alignment
 from .utils import jaccard
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredCandidate:
     id: str
     phrase: str
@@ -29,6 +30,18 @@ def clamp01(x: float) -> float:
     return max(0.0, min(1.0, float(x)))
 
 
+def _component_weights(scoring_model: Dict[str, Any]) -> Dict[str, float]:
+    weights = scoring_model.get("scoring_model", {}).get("relevance_score", {}).get("components", {})
+    return {k: float(v.get("weight", 0.0)) for k, v in weights.items()}
+
+
+def _relevance(feats: Dict[str, float], w: Dict[str, float]) -> float:
+    rel = 0.0
+    for k, wk in w.items():
+        rel += wk * float(feats.get(k, 0.0))
+    return clamp01(rel)
+
+
 def build_tfidf_embeddings(texts: List[str]) -> np.ndarray:
     vec = TfidfVectorizer(ngram_range=(1, 2), min_df=1)
     X = vec.fit_transform(texts)
@@ -53,8 +66,7 @@ def score_candidates(
       cosine similarity vector sim(seed, candidate).
     """
 
-    weights = scoring_model.get("scoring_model", {}).get("relevance_score", {}).get("components", {})
-    w = {k: float(v.get("weight", 0.0)) for k, v in weights.items()}
+    w = _component_weights(scoring_model)
 
     # TF-IDF embedding similarity
     texts = [seed_phrase] + [c["phrase"] for c in candidates]
@@ -87,10 +99,7 @@ def score_candidates(
             "perspective_alignment": clamp01(f_perspective_alignment),
         }
 
-        rel = 0.0
-        for k, wk in w.items():
-            rel += wk * float(feats.get(k, 0.0))
-        rel = clamp01(rel)
+        rel = _relevance(feats, w)
 
         scored.append(
             ScoredCandidate(
@@ -108,6 +117,23 @@ def score_candidates(
     return scored, X, sims
 
 
+def rescore_serp_overlap(
+    scored: List[ScoredCandidate],
+    serp_overlap: Dict[int, float],
+    scoring_model: Dict[str, Any],
+) -> None:
+    """Apply refined serp_overlap values (by row in `scored`) and refresh those rows' relevance.
+
+    Every other feature is independent of SERP evidence, so the TF-IDF matrix and
+    the remaining rows from score_candidates stay valid.
+    """
+    w = _component_weights(scoring_model)
+    for idx, ov in serp_overlap.items():
+        sc = scored[idx]
+        sc.features["serp_overlap"] = clamp01(ov)
+        sc.relevance_score = _relevance(sc.features, w)
+
+
 def mmr_select(
     scored: List[ScoredCandidate],
     X: np.ndarray,
@@ -131,33 +157,41 @@ def mmr_select(
     pool_idx = list(range(len(scored)))
     pool_idx.sort(key=lambda i: scored[i].relevance_score, reverse=True)
 
+    # Candidate rows (row 0 is the seed), L2-normalized once so cosine similarity is a dot product
+    Xn = normalize(X[1:])
+    # Running max cosine similarity of every candidate to the selected set
+    max_sim = np.full(len(scored), -np.inf)
+
     selected: List[int] = []
     intent_counts: Dict[str, int] = {}
     persp_counts: Dict[str, int] = {}
     near_dup_count = 0
 
+    def select(i: int) -> None:
+        nonlocal max_sim
+        selected.append(i)
+        c = scored[i]
+        intent_counts[c.intent] = intent_counts.get(c.intent, 0) + 1
+        persp_counts[c.perspective] = persp_counts.get(c.perspective, 0) + 1
+        # One sparse mat-vec per pick instead of re-comparing against every selected row
+        max_sim = np.maximum(max_sim, (Xn @ Xn[i].T).toarray().ravel())
+
     def can_add(i: int) -> bool:
-        nonlocal near_dup_count
         c = scored[i]
         if intent_counts.get(c.intent, 0) >= max_same_intent:
             return False
         if persp_counts.get(c.perspective, 0) >= max_same_perspective:
             return False
         # near-dup guard
-        if selected:
-            sims = cosine_similarity(X[i+1:i+2], X[[j+1 for j in selected]]).flatten()
-            if sims.size and float(sims.max()) >= near_dup_sim:
-                if near_dup_count >= max_near_duplicate:
-                    return False
+        if selected and float(max_sim[i]) >= near_dup_sim:
+            if near_dup_count >= max_near_duplicate:
+                return False
         return True
 
     # Start with best that satisfies constraints
     for i in pool_idx:
         if can_add(i):
-            selected.append(i)
-            c = scored[i]
-            intent_counts[c.intent] = intent_counts.get(c.intent, 0) + 1
-            persp_counts[c.perspective] = persp_counts.get(c.perspective, 0) + 1
+            select(i)
             break
 
     # MMR loop
@@ -171,11 +205,7 @@ def mmr_select(
             if not can_add(i):
                 continue
             # redundancy to selected
-            if not selected:
-                redundancy = 0.0
-            else:
-                sims = cosine_similarity(X[i+1:i+2], X[[j+1 for j in selected]]).flatten()
-                redundancy = float(sims.max()) if sims.size else 0.0
+            redundancy = float(max_sim[i]) if selected else 0.0
 
             val = mmr_lambda * scored[i].relevance_score - (1.0 - mmr_lambda) * redundancy
             if val > best_val:
@@ -196,11 +226,7 @@ def mmr_select(
         if best_i is None:
             break
 
-        selected.append(best_i)
         remaining.remove(best_i)
-
-        c = scored[best_i]
-        intent_counts[c.intent] = intent_counts.get(c.intent, 0) + 1
-        persp_counts[c.perspective] = persp_counts.get(c.perspective, 0) + 1
+        select(best_i)
 
     return [scored[i] for i in selected][:k]
@@ -6,6 +6,13 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .utils import engine_home
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _env(name: str) -> Optional[str]:
     v = os.getenv(name)
@@ -92,7 +99,7 @@ class Secrets:
 
 
 def default_secrets_path() -> Path:
-    base = Path(os.getenv("SYNAPSE_ENGINE_HOME", str(Path.home() / ".synapse_engine")))
+    base = engine_home()
     base.mkdir(parents=True, exist_ok=True)
     return base / "secrets.json"
 
@@ -102,7 +109,8 @@ def load_secrets(path: Optional[Path] = None) -> Secrets:
     if not path.exists():
         return Secrets()
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
         return Secrets.from_dict(data if isinstance(data, dict) else {})
     except Exception:
         # Fail closed: return empty secrets rather than crashing.
@@ -112,4 +120,11 @@ def load_secrets(path: Optional[Path] = None) -> Secrets:
 def save_secrets(secrets: Secrets, path: Optional[Path] = None) -> None:
     path = path or default_secrets_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(secrets.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    # Write a sibling temp file and swap it in, so readers never see a half-written file
+    tmp = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        payload = orjson.dumps(secrets.to_dict(), option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(secrets.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .providers.dataforseo import DataForSEOClient, parse_serp_snapshot
-from .utils import jaccard
+from .utils import jaccard, remember
 
 
-@dataclass
+# Parsed SERPs shared across runs: (endpoint, keyword, locale, depth) -> (fetched_at, parsed snapshot)
+_SERP_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_SERP_CACHE_LOCK = threading.Lock()
+_SERP_CACHE_SIZE = 1024
+_SERP_CACHE_TTL_SECONDS = 24 * 3600
+
+
+@dataclass(slots=True)
 class SerpSnapshot:
     keyword: str
     top_urls: List[str]
@@ -35,14 +44,23 @@ def fetch_seed_serp(
     language_code: Optional[str] = None,
     depth: int = 10,
 ) -> SerpSnapshot:
-    payload = dfs.serp_live_advanced(
-        keyword=keyword,
-        location_name=location_name,
-        location_code=location_code,
-        language_code=language_code,
-        depth=depth,
-    )
-    snap = parse_serp_snapshot(payload)
+    key = (getattr(dfs, "base_url", None), keyword, location_name, location_code, language_code, int(depth))
+    hit = _SERP_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _SERP_CACHE_TTL_SECONDS:
+        snap = hit[1]
+    else:
+        payload = dfs.serp_live_advanced(
+            keyword=keyword,
+            location_name=location_name,
+            location_code=location_code,
+            language_code=language_code,
+            depth=depth,
+        )
+        snap = parse_serp_snapshot(payload)
+        # Don't pin an empty answer (e.g. a failed task) for the whole TTL
+        if snap.get("top_urls"):
+            with _SERP_CACHE_LOCK:
+                remember(_SERP_CACHE, key, (time.monotonic(), snap), _SERP_CACHE_SIZE)
     return SerpSnapshot(
         keyword=keyword,
         top_urls=list(snap.get("top_urls", []) or []),
@@ -53,5 +71,6 @@ def fetch_seed_serp(
     )
 
 
-def serp_overlap(seed_top_urls: List[str], cand_top_urls: List[str]) -> float:
+def serp_overlap(seed_top_urls: Iterable[str], cand_top_urls: Iterable[str]) -> float:
+    """Jaccard overlap of two top-URL lists; pass sets to skip the conversion."""
     return float(jaccard(seed_top_urls, cand_top_urls))
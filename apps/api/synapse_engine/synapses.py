@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional
 
+import numpy as np
+
 from .intent import intent_distance
 from .perspective import perspective_distance
 
@@ -171,19 +173,21 @@ def build_intra_cluster_edges(
     for cid, arr in by_cluster.items():
         if len(arr) < 2:
             continue
-        # For each node, connect to the node with max embedding similarity in cluster
-        for a in arr:
-            best = None
-            best_sim = -1.0
-            for b in arr:
-                if a["id"] == b["id"]:
-                    continue
-                sim = float(min(a.get("features", {}).get("embedding_similarity", 0.0), b.get("features", {}).get("embedding_similarity", 0.0)))
-                if sim > best_sim:
-                    best_sim = sim
-                    best = b
-            if best is None:
+        # For each node, connect to the node with max embedding similarity in cluster.
+        # Pair similarity is min(sim_a, sim_b); computed for the whole cluster at once.
+        emb = np.fromiter(
+            (float(n.get("features", {}).get("embedding_similarity", 0.0)) for n in arr), dtype=float, count=len(arr)
+        )
+        ids = np.array([n["id"] for n in arr], dtype=object)
+        pair_sim = np.minimum.outer(emb, emb)
+        pair_sim[ids[:, None] == ids[None, :]] = -np.inf  # never link a node to itself
+        best_idx = pair_sim.argmax(axis=1)  # first maximum, as in a left-to-right scan
+        best_sims = pair_sim[np.arange(len(arr)), best_idx]
+
+        for a, bi, best_sim in zip(arr, best_idx.tolist(), best_sims.tolist()):
+            if best_sim == -np.inf:
                 continue
+            best = arr[bi]
             strength = float(max(0.0, min(1.0, 0.5 * (a.get("relevance_score", 0.0) + best.get("relevance_score", 0.0)))))
             if strength < min_strength:
                 continue
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
-from typing import Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import AbstractSet, Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+def engine_home() -> Path:
+    """Local state directory (secrets, provider caches); override with SYNAPSE_ENGINE_HOME."""
+    return Path(os.getenv("SYNAPSE_ENGINE_HOME", str(Path.home() / ".synapse_engine")))
 
 
 def slugify(text: str) -> str:
@@ -18,12 +27,14 @@ def slugify(text: str) -> str:
     return t or "x"
 
 
+@lru_cache(maxsize=8192)
 def stable_qid(phrase: str, language: str, market: str) -> str:
     """Stable query ID as q.<hash>.
 
-    Keep it short for UI, but stable across runs.
+    Keep it short for UI, but stable across runs. The hash function is part of the
+    ID format: IDs are baked into saved artifacts, so do not swap it for a faster one.
     """
-    h = hashlib.sha1(f"{language}:{market}:{phrase}".encode("utf-8")).hexdigest()[:10]
+    h = hashlib.sha1(f"{language}:{market}:{phrase}".encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
     return f"q.{h}"
 
 
@@ -50,9 +61,38 @@ def content_tokens(text: str) -> List[str]:
 
 
 def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
-    sa, sb = set(a), set(b)
+    # Sets are used as-is; anything else is converted once
+    sa = a if isinstance(a, AbstractSet) else set(a)
+    sb = b if isinstance(b, AbstractSet) else set(b)
     if not sa and not sb:
         return 1.0
     if not sa or not sb:
         return 0.0
     return len(sa & sb) / len(sa | sb)
+
+
+def fetch_concurrently(calls: List[Callable[[], Any]], max_workers: Optional[int] = None) -> List[Optional[Any]]:
+    """Run blocking provider calls in parallel threads; results keep call order.
+
+    A call that raises yields None, so one failing provider never affects the others.
+    """
+    if not calls:
+        return []
+    workers = max(1, min(len(calls), max_workers or len(calls)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call) for call in calls]
+        results: List[Optional[Any]] = []
+        for f in futures:
+            try:
+                results.append(f.result())
+            except Exception:
+                results.append(None)
+        return results
+
+
+def remember(cache: Dict[Hashable, Any], key: Hashable, value: Any, maxsize: int) -> None:
+    """Insert into a small FIFO-bounded dict cache, evicting the oldest entries."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > maxsize:
+        cache.pop(next(iter(cache)))
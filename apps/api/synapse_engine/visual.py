@@ -4,6 +4,8 @@ import datetime as dt
 import hashlib
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from .intent import intent_x_position, intent_distance
 from .perspective import perspective_y_position, perspective_distance
 
@@ -22,6 +24,13 @@ def clamp01(x: float) -> float:
     return max(0.0, min(1.0, float(x)))
 
 
+def node_sizes(relevance: np.ndarray, search_volume: np.ndarray) -> np.ndarray:
+    """Node radius: 6 + 18*relevance, plus up to 4 for positive search volume (log10 scale)."""
+    has_vol = search_volume > 0
+    bonus = 4.0 * np.minimum(1.0, np.log10(1.0 + np.where(has_vol, search_volume, 0.0)) / 5.0)
+    return (6 + 18 * relevance) + np.where(has_vol, bonus, 0.0)
+
+
 def compute_anchor_distance(
     seed_intent: str,
     seed_perspective: str,
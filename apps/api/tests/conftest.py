@@ -24,3 +24,10 @@ def spec_pack(spec_root):
     """Loaded SpecPack with all YAML models."""
     from synapse_engine.models import load_base_pack
     return load_base_pack(spec_root)
+
+
+@pytest.fixture(autouse=True)
+def _empty_serp_cache():
+    """Fake providers answer differently per test; never serve a SERP parsed in another test."""
+    from synapse_engine import serp
+    serp._SERP_CACHE.clear()
@@ -0,0 +1,43 @@
+"""Tests for provider-backed candidate generation (M3)."""
+import threading
+
+
+class _FakeDataForSEO:
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def keyword_suggestions(self, seed, **kwargs):
+        self.barrier.wait()
+        return {"tasks": [{"result": [{"items": [{"keyword": "dfs suggestion"}]}]}]}
+
+    def related_keywords(self, seed, **kwargs):
+        raise RuntimeError("quota exceeded")
+
+
+class _FakeAhrefs:
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def keywords_matching_terms(self, keywords, limit=1000):
+        self.barrier.wait()
+        return {"data": [{"keyword": "ahrefs term"}]}
+
+
+def test_provider_calls_fan_out_and_failures_are_isolated():
+    """Provider calls are in flight together; one failing call keeps the others' rows."""
+    from synapse_engine.candidates import generate_candidates
+    from synapse_engine.runtime import Runtime
+    from synapse_engine.secrets import Secrets
+
+    # Both successful calls must block on each other, so a sequential fan-out times out.
+    barrier = threading.Barrier(2, timeout=5)
+    runtime = Runtime.build(secrets=Secrets())
+    runtime.providers.dataforseo = _FakeDataForSEO(barrier)
+    runtime.providers.ahrefs = _FakeAhrefs(barrier)
+
+    pool = generate_candidates("privatlån", "sv", "SE", target_pool=300, runtime=runtime)
+
+    by_phrase = {c.phrase: c for c in pool}
+    assert by_phrase["dfs suggestion"].rationale == "DataForSEO Labs: keyword_suggestions"
+    assert by_phrase["ahrefs term"].rationale == "Ahrefs v3: keywords_matching_terms"
+    assert not any("related_keywords" in c.rationale for c in pool)
@@ -84,3 +84,17 @@ def test_pipeline_cluster_count(spec_root):
         assert "centroid" in c
         assert "x" in c["centroid"]
         assert "y" in c["centroid"]
+
+
+def test_schema_validator_reuse(spec_root):
+    """A shared validator accepts valid artifacts and rejects broken ones on repeat calls."""
+    import jsonschema
+    from synapse_engine.models import get_validator
+    from synapse_engine.pipeline import run_pipeline
+
+    graph, _ = run_pipeline("casino online", spec_root=spec_root, target=10)
+    sv = get_validator(spec_root / "03_schemas")
+    for _ in range(2):
+        sv.validate(graph, "GraphArtifact.schema.json")
+        with pytest.raises(jsonschema.ValidationError):
+            sv.validate({"nodes": "x"}, "GraphArtifact.schema.json")
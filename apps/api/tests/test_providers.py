@@ -0,0 +1,78 @@
+"""Tests for provider clients."""
+from types import SimpleNamespace
+
+import pytest
+
+
+class _FakeHttp:
+    """Serves one payload with an ETag and answers 304 when the client sends it back."""
+
+    def __init__(self, content, etag):
+        self.content = content
+        self.etag = etag
+        self.sent_headers = []
+
+    def send(self, method, url, headers=None, **kwargs):
+        self.sent_headers.append(headers or {})
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return SimpleNamespace(status_code=304, headers={}, content=b"")
+        return SimpleNamespace(status_code=200, headers={"ETag": self.etag}, content=self.content)
+
+    def decode(self, content):
+        from synapse_engine.providers.http import HttpClient
+        return HttpClient.decode(content)
+
+
+def test_locations_and_languages_revalidates_with_etag(tmp_path):
+    """The second call sends If-None-Match and reads the body from the disk cache on 304."""
+    from synapse_engine.providers.dataforseo import DataForSEOClient, DataForSEOCredentials
+
+    http = _FakeHttp(b'{"tasks": [{"result": [{"location_code": 2752}]}]}', '"v1"')
+    client = DataForSEOClient(DataForSEOCredentials("login", "pw"), http=http)
+
+    first = client.locations_and_languages(cache_dir=tmp_path)
+    second = client.locations_and_languages(cache_dir=tmp_path)
+
+    assert http.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert first == second == {"tasks": [{"result": [{"location_code": 2752}]}]}
+    assert (tmp_path / "loc_lang.etag").read_text() == '"v1"'
+
+
+class _ScriptedSession:
+    """Stands in for requests.Session: answers with the given (status, headers) in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        status, headers = self.responses.pop(0)
+        return SimpleNamespace(status_code=status, headers=headers, content=b'{"ok": 1}', text="", json=dict)
+
+
+def _client(responses):
+    from synapse_engine.providers.http import HttpClient, RetryPolicy
+
+    http = HttpClient(RetryPolicy(retries=2, backoff_seconds=0.0))
+    http._session = _ScriptedSession(responses)
+    return http
+
+
+def test_http_retries_429_after_retry_after():
+    """A 429 is retried once its Retry-After has elapsed."""
+    http = _client([(429, {"Retry-After": "0"}), (200, {})])
+
+    assert http.request("GET", "https://api.example.com/x") == {"ok": 1}
+    assert http._session.calls == 2
+
+
+def test_http_does_not_retry_client_errors():
+    """Non-retryable statuses fail on the first attempt instead of burning retries."""
+    from synapse_engine.providers.http import ProviderError
+
+    http = _client([(401, {}), (200, {})])
+
+    with pytest.raises(ProviderError, match="HTTP 401"):
+        http.request("GET", "https://api.example.com/x")
+    assert http._session.calls == 1
@@ -88,3 +88,28 @@ def test_relevance_scores_in_range(spec_pack):
     )
     for sc in scored:
         assert 0.0 <= sc.relevance_score <= 1.0, f"Score {sc.relevance_score} out of range"
+
+
+def test_rescore_serp_overlap_matches_full_rescore(spec_pack):
+    """Patching serp_overlap on a few rows gives the same scores as scoring from scratch."""
+    from synapse_engine.scoring import score_candidates, rescore_serp_overlap
+
+    seed, candidates = _make_test_candidates(spec_pack, n=20)
+    kwargs = dict(
+        seed_phrase=seed,
+        seed_intent="transactional",
+        seed_perspective="provider",
+        language="sv",
+        market="SE",
+        scoring_model=spec_pack.scoring_model,
+        perspective_model=spec_pack.perspective_model,
+    )
+    scored, _, _ = score_candidates(candidates=candidates, **kwargs)
+
+    refined = {0: 0.5, 3: 1.0, 7: 0.25}
+    rescore_serp_overlap(scored, refined, spec_pack.scoring_model)
+    for idx, ov in refined.items():
+        candidates[idx]["serp_overlap"] = ov
+    expected, _, _ = score_candidates(candidates=candidates, **kwargs)
+
+    assert [(s.features, s.relevance_score) for s in scored] == [(s.features, s.relevance_score) for s in expected]
@@ -0,0 +1,110 @@
+"""Tests for SERP snapshots and SERP refinement."""
+import threading
+
+
+def _serp_payload(urls):
+    return {"tasks": [{"result": [{"items": [{"type": "organic", "url": u} for u in urls]}]}]}
+
+
+class _FakeDataForSEO:
+    """Seed SERP answers immediately; candidate SERPs block until all of them are in flight."""
+
+    def __init__(self, seed, barrier):
+        self.seed = seed
+        self.barrier = barrier
+        self.keywords = []
+
+    def serp_live_advanced(self, keyword, **kwargs):
+        self.keywords.append(keyword)
+        if keyword == self.seed:
+            return _serp_payload(["https://a.se/", "https://b.se/", "https://c.se/"])
+        self.barrier.wait()
+        return _serp_payload(["https://a.se/", "https://x.se/"])
+
+    def keyword_suggestions(self, seed, **kwargs):
+        return {}
+
+    def related_keywords(self, seed, **kwargs):
+        return {}
+
+
+def test_serp_refinement_runs_concurrently(spec_root):
+    """Candidate SERP calls are issued together and their overlap lands on the selected nodes."""
+    from synapse_engine.pipeline import run_pipeline
+    from synapse_engine.runtime import Budget, Runtime
+    from synapse_engine.secrets import Secrets
+
+    refine_n = 3
+    barrier = threading.Barrier(refine_n, timeout=5)
+    budget = Budget(candidate_pool_target=60, serp_refine_top_n=refine_n, serp_calls_max=10)
+    runtime = Runtime.build(secrets=Secrets(), budget=budget)
+    seed = "privatlån"
+    fake = _FakeDataForSEO(seed, barrier)
+    runtime.providers.dataforseo = fake
+
+    _, related = run_pipeline(seed, spec_root=spec_root, target=20, runtime=runtime)
+
+    assert len(fake.keywords) == 1 + refine_n
+    refined = [s for s in related["selected"] if s["metrics"]["serp_shared_urls"]]
+    assert refined
+    assert all(s["metrics"]["serp_shared_urls"] == ["https://a.se/"] for s in refined)
+
+
+def test_parse_serp_snapshot_dedups_in_order_and_caps_urls():
+    """Repeated URLs/questions keep their first position; top URLs stop at 20."""
+    from synapse_engine.providers.dataforseo import parse_serp_snapshot
+
+    items = [{"type": "organic", "url": f"https://u{i % 25}.se/"} for i in range(60)]
+    items.insert(3, {"type": "people_also_ask", "items": [{"question": "a"}, {"question": "b"}, {"title": "a"}]})
+    items.append({"type": "related_searches", "items": [{"query": "x"}, {"query": "x"}, {"title": "y"}]})
+
+    snap = parse_serp_snapshot({"tasks": [{"result": [{"items": items}]}]})
+
+    assert snap["top_urls"] == [f"https://u{i}.se/" for i in range(20)]
+    assert snap["paa"] == ["a", "b"]
+    assert snap["related"] == ["x", "y"]
+    assert snap["features"] == ["organic", "people_also_ask", "related_searches"]
+
+
+class _OverlapDataForSEO(_FakeDataForSEO):
+    """The seed SERP and keyword_suggestions only return once both are in flight."""
+
+    def serp_live_advanced(self, keyword, **kwargs):
+        self.keywords.append(keyword)
+        self.barrier.wait()
+        return _serp_payload(["https://a.se/"])
+
+    def keyword_suggestions(self, seed, **kwargs):
+        self.barrier.wait()
+        return {}
+
+
+def test_seed_serp_overlaps_candidate_providers(spec_root):
+    """The seed SERP request runs alongside the candidate provider calls."""
+    from synapse_engine.pipeline import run_pipeline
+    from synapse_engine.runtime import Budget, Runtime
+    from synapse_engine.secrets import Secrets
+
+    barrier = threading.Barrier(2, timeout=5)
+    budget = Budget(candidate_pool_target=60, serp_refine_top_n=0, serp_calls_max=10)
+    runtime = Runtime.build(secrets=Secrets(), budget=budget)
+    seed = "privatlån"
+    runtime.providers.dataforseo = _OverlapDataForSEO(seed, barrier)
+
+    run_pipeline(seed, spec_root=spec_root, target=20, runtime=runtime)
+
+    assert runtime.providers.dataforseo.keywords == [seed]
+    assert not barrier.broken
+
+
+def test_fetch_seed_serp_reuses_parsed_snapshot():
+    """A repeated (keyword, locale, depth) request is served from the parsed-SERP cache."""
+    from synapse_engine.serp import fetch_seed_serp
+
+    fake = _FakeDataForSEO("lån", threading.Barrier(1))
+    first = fetch_seed_serp(fake, "lån", location_code=2752, language_code="sv")
+    second = fetch_seed_serp(fake, "lån", location_code=2752, language_code="sv")
+    fetch_seed_serp(fake, "lån", location_code=2752, language_code="sv", depth=20)
+
+    assert fake.keywords == ["lån", "lån"]
+    assert first.top_urls == second.top_urls == ["https://a.se/", "https://b.se/", "https://c.se/"]